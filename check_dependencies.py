@@ -1,40 +1,59 @@
 """Check if all required dependencies are available."""
 
 import sys
-import importlib
+import functools
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Serializes status prints so threaded probes don't interleave output
+_print_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=None)
+def _module_available(module_name):
+    """Probe availability via the import finders, without executing the module."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # find_spec raises if a parent package is missing or broken
+        return False
 
 def check_dependency(module_name, package_name=None):
     """Check if a dependency is available."""
-    try:
-        importlib.import_module(module_name)
-        print(f"✅ {package_name or module_name}")
+    if _module_available(module_name):
+        with _print_lock:
+            print(f"✅ {package_name or module_name}")
         return True
-    except ImportError:
-        print(f"❌ {package_name or module_name} - Not installed")
+    else:
+        with _print_lock:
+            print(f"❌ {package_name or module_name} - Not installed")
         return False
 
+# Immutable module-level table of (module, display name) pairs
+_DEPENDENCIES = (
+    ("fastapi", "FastAPI"),
+    ("uvicorn", "Uvicorn"),
+    ("pydantic", "Pydantic"),
+    ("pydantic_settings", "Pydantic Settings"),
+    ("google.genai", "Google GenAI"),
+    ("pinecone", "Pinecone"),
+    ("fitz", "PyMuPDF"),
+    ("docx", "python-docx"),
+    ("aiohttp", "aiohttp"),
+    ("loguru", "Loguru"),
+    ("dotenv", "python-dotenv"),
+)
+
 def main():
     """Check all dependencies."""
     print("🔍 Checking Dependencies...\n")
     
-    dependencies = [
-        ("fastapi", "FastAPI"),
-        ("uvicorn", "Uvicorn"),
-        ("pydantic", "Pydantic"),
-        ("pydantic_settings", "Pydantic Settings"),
-        ("google.genai", "Google GenAI"),
-        ("pinecone", "Pinecone"),
-        ("fitz", "PyMuPDF"),
-        ("docx", "python-docx"),
-        ("aiohttp", "aiohttp"),
-        ("loguru", "Loguru"),
-        ("dotenv", "python-dotenv"),
-    ]
+    dependencies = _DEPENDENCIES
     
-    results = []
-    for module, name in dependencies:
-        result = check_dependency(module, name)
-        results.append(result)
+    # Probe concurrently: the import lock serializes module init, but disk
+    # reads and shared-library loading still overlap across threads.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda dep: check_dependency(*dep), dependencies))
     
     print(f"\n📊 Results: {sum(results)}/{len(results)} dependencies available")
     
@@ -1,23 +1,60 @@
 """Simple environment check without external dependencies."""
 
+import functools
 import os
+import re
+from types import MappingProxyType
 
-def load_env_file():
+# Matches KEY=value lines; comment lines fail the key charset and are
+# skipped. Intra-line whitespace is [ \t] only — \s would match the
+# newline and make an empty value (KEY=) swallow the following line.
+_ENV_LINE_RE = re.compile(r'(?m)^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*(.*?)[ \t]*$')
+
+# Characters allowed in API key bodies (no regex needed for validation)
+_KEY_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_'
+)
+
+
+def _valid_gemini_key(key):
+    """Cheap length + prefix + charset check for Gemini API keys."""
+    return len(key) >= 39 and key[:4] == 'AIza' and _KEY_CHARS.issuperset(key[4:])
+
+
+def _valid_pinecone_key(key):
+    """Cheap length + prefix + charset check for Pinecone API keys."""
+    return len(key) > 40 and key[:5] == 'pcsk_' and _KEY_CHARS.issuperset(key[5:])
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_env_file(path, mtime_ns, size):
+    """Parse an env file into a read-only dict (cached per file version).
+
+    The mtime_ns/size arguments are part of the cache key so the file is
+    re-parsed only when it actually changes on disk.
+    """
+    with open(path, 'r') as f:
+        text = f.read()
+    return MappingProxyType(dict(_ENV_LINE_RE.findall(text)))
+
+
+def load_env_file(path='.env'):
     """Load environment variables from .env file."""
-    env_vars = {}
     try:
-        with open('.env', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    env_vars[key.strip()] = value.strip()
-                    os.environ[key.strip()] = value.strip()
-        return env_vars
+        stat = os.stat(path)
+        env_vars = _parse_env_file(path, stat.st_mtime_ns, stat.st_size)
     except FileNotFoundError:
         print("❌ .env file not found")
         return {}
 
+    # Only touch os.environ when a value actually changed — each write is
+    # a putenv(3) call, and repeated invocations become no-ops.
+    environ = os.environ
+    for key, value in env_vars.items():
+        if environ.get(key) != value:
+            environ[key] = value
+    return env_vars
+
 def check_environment():
     """Check environment configuration."""
     print("🔧 Checking Environment Configuration...\n")
@@ -79,7 +116,7 @@ def check_environment():
     
     gemini_key = env_vars.get('GEMINI_API_KEY', '')
     if gemini_key:
-        if gemini_key.startswith('AIza') and len(gemini_key) > 30:
+        if _valid_gemini_key(gemini_key):
             print("✅ Gemini API key format looks correct")
         else:
             print("⚠️  Gemini API key format may be incorrect")
@@ -87,7 +124,7 @@ def check_environment():
     
     pinecone_key = env_vars.get('PINECONE_API_KEY', '')
     if pinecone_key:
-        if pinecone_key.startswith('pcsk_') and len(pinecone_key) > 40:
+        if _valid_pinecone_key(pinecone_key):
             print("✅ Pinecone API key format looks correct")
         else:
             print("⚠️  Pinecone API key format may be incorrect")
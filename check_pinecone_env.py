@@ -2,8 +2,14 @@
 """Check available Pinecone environments and help configure the correct one."""
 
 import os
+import re
+from pathlib import Path
+
 from dotenv import load_dotenv
 
+# Compiled once; rewrites the PINECONE_ENVIRONMENT line in a single pass
+_PINECONE_ENV_RE = re.compile(r'(?m)^PINECONE_ENVIRONMENT=.*$')
+
 # Load environment variables
 load_dotenv()
 
@@ -52,54 +58,10 @@ def check_pinecone_environments():
             "asia-northeast1-gcp"
         ]
         
-        working_env = None
-        
-        for env in test_environments:
-            try:
-                print(f"  🔍 Testing {env}...")
-                
-                # Try to create a test index (we'll delete it immediately)
-                from pinecone import ServerlessSpec
-                
-                test_index_name = "test-env-check"
-                
-                # Try to create index with this environment
-                pc.create_index(
-                    name=test_index_name,
-                    dimension=768,
-                    metric="cosine",
-                    spec=ServerlessSpec(
-                        cloud="aws" if "aws" in env else "gcp",
-                        region=env
-                    )
-                )
-                
-                print(f"  ✅ {env} - WORKING!")
-                working_env = env
-                
-                # Clean up test index
-                try:
-                    pc.delete_index(test_index_name)
-                    print(f"  🧹 Cleaned up test index")
-                except:
-                    pass
-                
-                break  # Found working environment
-                
-            except Exception as e:
-                error_msg = str(e).lower()
-                if "not found" in error_msg or "404" in error_msg:
-                    print(f"  ❌ {env} - Not available")
-                elif "already exists" in error_msg:
-                    print(f"  ✅ {env} - Available (test index already exists)")
-                    working_env = env
-                    break
-                elif "quota" in error_msg or "limit" in error_msg:
-                    print(f"  ⚠️  {env} - Available but quota exceeded")
-                    working_env = env
-                    break
-                else:
-                    print(f"  ❓ {env} - Error: {e}")
+        # Probe all regions concurrently — each create_index call is a
+        # network round-trip, so latency drops from sum-of-RTTs to the
+        # first successful response.
+        working_env = probe_environments_concurrently(pc, test_environments)
         
         if working_env:
             print(f"\n🎉 Found working environment: {working_env}")
@@ -124,31 +86,100 @@ def check_pinecone_environments():
     except Exception as e:
         print(f"❌ Error checking Pinecone: {e}")
 
+def probe_environment(pc, env):
+    """Try to create (and clean up) a test index in one environment.
+
+    Returns a (status, message) tuple where status is one of
+    'working', 'unavailable' or 'error'.
+    """
+    from pinecone import ServerlessSpec
+
+    # Unique per-environment name so concurrent probes don't collide
+    test_index_name = f"test-env-check-{env}"
+
+    try:
+        pc.create_index(
+            name=test_index_name,
+            dimension=768,
+            metric="cosine",
+            spec=ServerlessSpec(
+                cloud="aws" if "aws" in env else "gcp",
+                region=env
+            )
+        )
+
+        # Clean up test index
+        try:
+            pc.delete_index(test_index_name)
+        except:
+            pass
+
+        return "working", "WORKING!"
+
+    except Exception as e:
+        error_msg = str(e).lower()
+        if "not found" in error_msg or "404" in error_msg:
+            return "unavailable", "Not available"
+        elif "already exists" in error_msg:
+            return "working", "Available (test index already exists)"
+        elif "quota" in error_msg or "limit" in error_msg:
+            # Ambiguous under concurrent probing: a sibling probe may
+            # have consumed the index quota, so this says nothing about
+            # whether THIS region works. Don't report it as working.
+            return "quota", "Quota/limit hit (ambiguous while probing concurrently)"
+        else:
+            return "error", f"Error: {e}"
+
+
+def probe_environments_concurrently(pc, environments):
+    """Probe candidate environments in parallel, returning the first working one."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    print(f"  🔍 Testing {len(environments)} environments concurrently...")
+
+    # No `with` block: ThreadPoolExecutor.__exit__ calls
+    # shutdown(wait=True), which would join every in-flight probe and
+    # defeat the early return. Shut down without waiting instead; the
+    # remaining probes finish in the background and clean up after
+    # themselves.
+    executor = ThreadPoolExecutor(max_workers=len(environments))
+    try:
+        futures = {
+            executor.submit(probe_environment, pc, env): env
+            for env in environments
+        }
+
+        for future in as_completed(futures):
+            env = futures[future]
+            status, message = future.result()
+
+            if status == "working":
+                print(f"  ✅ {env} - {message}")
+                return env
+            elif status == "unavailable":
+                print(f"  ❌ {env} - {message}")
+            else:
+                print(f"  ❓ {env} - {message}")
+
+        return None
+    finally:
+        executor.shutdown(wait=False)
+
+
 def update_env_file(working_env):
     """Update the .env file with the working environment."""
     try:
-        # Read current .env file
-        with open('.env', 'r') as f:
-            lines = f.readlines()
-        
-        # Update the PINECONE_ENVIRONMENT line
-        updated_lines = []
-        env_updated = False
-        
-        for line in lines:
-            if line.startswith('PINECONE_ENVIRONMENT='):
-                updated_lines.append(f'PINECONE_ENVIRONMENT={working_env}\n')
-                env_updated = True
-            else:
-                updated_lines.append(line)
-        
-        # If PINECONE_ENVIRONMENT wasn't found, add it
-        if not env_updated:
-            updated_lines.append(f'PINECONE_ENVIRONMENT={working_env}\n')
-        
-        # Write back to .env file
-        with open('.env', 'w') as f:
-            f.writelines(updated_lines)
+        env_path = Path('.env')
+        text = env_path.read_text()
+
+        # Single regex pass; append the line if it wasn't present
+        new_text, replaced = _PINECONE_ENV_RE.subn(
+            f'PINECONE_ENVIRONMENT={working_env}', text
+        )
+        if replaced == 0:
+            new_text = text + f'\nPINECONE_ENVIRONMENT={working_env}\n'
+
+        env_path.write_text(new_text)
         
         print(f"✅ Updated .env file with PINECONE_ENVIRONMENT={working_env}")
         
@@ -1,17 +1,28 @@
 """Main entry point for the Intelligent Query Retrieval System."""
 
-import uvicorn
-from src.api.main import app
-from src.core.config import get_settings
-
 
 if __name__ == "__main__":
+    # Deferred so importing this module doesn't pay the uvicorn/fastapi
+    # import cost; uvicorn loads the app itself from the import string.
+    import os
+
+    import uvicorn
+
+    from src.core.config import get_settings
+
     settings = get_settings()
-    
+
     uvicorn.run(
         "src.api.main:app",
         host=settings.host,
         port=settings.port,
+        # uvloop + httptools give much better asyncio scheduling for this
+        # I/O-bound API; "auto" falls back to asyncio/h11 when unavailable.
+        loop="auto",
+        http="auto",
+        # Multiple workers are incompatible with reload, so scale out only
+        # in production mode.
+        workers=1 if settings.debug else (os.cpu_count() or 1),
         reload=settings.debug,
         log_level=settings.log_level.lower()
     )
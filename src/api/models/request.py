@@ -1,53 +1,62 @@
 """Request models for the API."""
 
-from typing import List
-from pydantic import BaseModel, Field, HttpUrl, validator
+from typing import Final, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+MAX_QUESTIONS: Final[int] = 10
+MAX_QUESTION_LENGTH: Final[int] = 500
 
 
 class QueryRequest(BaseModel):
     """Request model for the main query endpoint."""
-    
+
+    # defer_build=False compiles the core schema at import time so the
+    # first request doesn't pay for validator construction.
+    model_config = ConfigDict(
+        defer_build=False,
+        populate_by_name=True,
+        json_schema_extra={
+            "example": {
+                "documents": "https://storage.googleapis.com/example-bucket/insurance-policy.pdf",
+                "questions": [
+                    "What is the waiting period for pre-existing diseases (PED) to be covered?",
+                    "Does this policy cover maternity expenses, and what are the conditions?",
+                    "What are the exclusions for this insurance policy?"
+                ]
+            }
+        },
+    )
+
     documents: str = Field(
         ...,
         description="PDF Blob URL pointing to the document to analyze",
-        example="https://example.com/document.pdf"
+        examples=["https://example.com/document.pdf"]
     )
-    
+
     questions: List[str] = Field(
         ...,
-        min_items=1,
+        min_length=1,
         description="List of questions to ask about the document",
-        example=[
+        examples=[[
             "What is the waiting period for pre-existing diseases (PED) to be covered?",
             "Does this policy cover maternity expenses, and what are the conditions?"
-        ]
+        ]]
     )
-    
-    @validator('questions')
-    def validate_questions_length(cls, v):
-        """Validate questions list length."""
-        if len(v) > 10:  # Max questions per request
-            raise ValueError('Maximum 10 questions allowed per request')
-        return v
-    
-    @validator('questions')
-    def validate_question_content(cls, v):
-        """Validate individual question content."""
+
+    @field_validator('questions')
+    @classmethod
+    def validate_questions(cls, v):
+        """Validate question count and content in a single pass."""
+        if len(v) > MAX_QUESTIONS:
+            raise ValueError(f'Maximum {MAX_QUESTIONS} questions allowed per request')
         for question in v:
             if not question.strip():
                 raise ValueError('Questions cannot be empty')
-            if len(question) > 500:
-                raise ValueError('Questions must be less than 500 characters')
+            if len(question) > MAX_QUESTION_LENGTH:
+                raise ValueError(f'Questions must be less than {MAX_QUESTION_LENGTH} characters')
         return v
-    
-    class Config:
-        schema_extra = {
-            "example": {
-                "documents": "https://storage.googleapis.com/example-bucket/insurance-policy.pdf",
-                "questions": [
-                    "What is the waiting period for pre-existing diseases (PED) to be covered?",
-                    "Does this policy cover maternity expenses, and what are the conditions?",
-                    "What are the exclusions for this insurance policy?"
-                ]
-            }
-        }
+
+
+# Force core-schema materialization at import so worker startup, not the
+# first request, pays the build cost.
+QueryRequest.model_rebuild()
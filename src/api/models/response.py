@@ -1,75 +1,88 @@
 """Response models for the API."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Shared config: build core schemas eagerly at import instead of on the
+# first validation/serialization.
+_EAGER_CONFIG = ConfigDict(defer_build=False, populate_by_name=True)
 
 
 class ClauseReference(BaseModel):
     """Reference to a specific clause in the document."""
-    
+
+    model_config = _EAGER_CONFIG
+
     page: Optional[int] = Field(
         None,
         description="Page number where the clause is found",
-        example=12
+        examples=[12]
     )
     
     clause_title: Optional[str] = Field(
         None,
         description="Title or description of the relevant clause",
-        example="Maternity Benefits"
+        examples=["Maternity Benefits"]
     )
 
 
 class ProcessingMetadata(BaseModel):
     """Metadata about the processing of the query."""
-    
+
+    # protected_namespaces cleared so the model_used field name is allowed
+    model_config = ConfigDict(
+        defer_build=False, populate_by_name=True, protected_namespaces=()
+    )
+
     model_used: str = Field(
         ...,
         description="The LLM model used for processing",
-        example="gemini-2.0-flash"
+        examples=["gemini-2.0-flash"]
     )
     
     embedding_model: str = Field(
         ...,
         description="The embedding model used",
-        example="text-embedding-004"
+        examples=["text-embedding-004"]
     )
     
     chunks_analyzed: int = Field(
         ...,
         description="Number of document chunks analyzed",
-        example=5
+        examples=[5]
     )
     
     total_tokens: Optional[int] = Field(
         None,
         description="Total tokens used in processing",
-        example=1247
+        examples=[1247]
     )
 
 
 class QueryAnswer(BaseModel):
     """Answer to a single query."""
-    
+
+    model_config = _EAGER_CONFIG
+
     question: str = Field(
         ...,
         description="The original question asked",
-        example="Does this policy cover maternity expenses, and what are the conditions?"
+        examples=["Does this policy cover maternity expenses, and what are the conditions?"]
     )
     
     isCovered: bool = Field(
         ...,
         description="Whether the queried topic is covered by the document",
-        example=True
+        examples=[True]
     )
     
     conditions: List[str] = Field(
         default_factory=list,
         description="List of conditions or requirements if any",
-        example=[
+        examples=[[
             "At least 24 months of continuous coverage",
             "Limited to two deliveries or terminations"
-        ]
+        ]]
     )
     
     clause_reference: ClauseReference = Field(
@@ -80,7 +93,7 @@ class QueryAnswer(BaseModel):
     rationale: str = Field(
         ...,
         description="Clear explanation of the decision and reasoning",
-        example="The clause states coverage is provided if the insured has been continuously covered for 24 months."
+        examples=["The clause states coverage is provided if the insured has been continuously covered for 24 months."]
     )
     
     confidence_score: float = Field(
@@ -88,7 +101,7 @@ class QueryAnswer(BaseModel):
         ge=0.0,
         le=1.0,
         description="Confidence score for the answer (0.0 to 1.0)",
-        example=0.92
+        examples=[0.92]
     )
     
     processing_metadata: ProcessingMetadata = Field(
@@ -99,35 +112,37 @@ class QueryAnswer(BaseModel):
 
 class ProcessingSummary(BaseModel):
     """Summary of the overall processing."""
-    
+
+    model_config = _EAGER_CONFIG
+
     total_questions: int = Field(
         ...,
         description="Total number of questions processed",
-        example=2
+        examples=[2]
     )
     
     successful_responses: int = Field(
         ...,
         description="Number of questions that were successfully processed",
-        example=2
+        examples=[2]
     )
     
     total_processing_time: str = Field(
         ...,
         description="Total time taken to process all queries",
-        example="3.2s"
+        examples=["3.2s"]
     )
     
     document_pages_processed: Optional[int] = Field(
         None,
         description="Number of document pages that were processed",
-        example=45
+        examples=[45]
     )
 
 
 class QueryResponse(BaseModel):
     """Response model for the main query endpoint."""
-    
+
     answers: List[QueryAnswer] = Field(
         ...,
         description="List of answers corresponding to the input questions"
@@ -137,9 +152,11 @@ class QueryResponse(BaseModel):
         ...,
         description="Summary of the processing operation"
     )
-    
-    class Config:
-        schema_extra = {
+
+    model_config = ConfigDict(
+        defer_build=False,
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "answers": [
                     {
@@ -170,4 +187,9 @@ class QueryResponse(BaseModel):
                     "document_pages_processed": 45
                 }
             }
-        }
+        },
+    )
+
+
+# Force the nested response schema tree to build at import time.
+QueryResponse.model_rebuild()
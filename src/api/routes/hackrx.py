@@ -2,12 +2,18 @@
 
 import time
 import asyncio
-import tempfile
+import hashlib
+import re
 import os
 import json
-from typing import List, Dict, Any
-from fastapi import APIRouter, HTTPException, Depends, UploadFile, File
-from fastapi.responses import JSONResponse
+import aiofiles.tempfile
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Depends, Request, UploadFile, File
+from fastapi.responses import JSONResponse, StreamingResponse
 from loguru import logger
 
 from ..models.request import QueryRequest
@@ -18,12 +24,245 @@ from ..models.response import (
 from ...services.document_processor import get_document_processor
 from ...services.retrieval_engine import get_retrieval_engine
 from ...services.decision_engine import get_decision_engine
+from ...services.semantic_cache import get_semantic_cache
 from ...core.gemini_client import get_gemini_client
 from ...core.config import get_settings
 
 
 router = APIRouter()
 
+# Strips leading/trailing ```json fences from model output in one pass
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+# Coverage indicators for the JSON-parse fallback: one compiled
+# alternation scan each instead of a separate substring search per word
+_POSITIVE_RE = re.compile(r"yes|covered|included|available|provided|benefits")
+_NEGATIVE_RE = re.compile(r"not covered|excluded|not included|no coverage|not available")
+
+# Deterministic coverage statements in document text ("... is covered",
+# "... is not covered", "... is excluded"); used by the LLM-free fast path
+_COVERAGE_RE = re.compile(r"\b(?:(?P<neg>not|never)\s+)?(?P<verb>covered|included|excluded)\b", re.IGNORECASE)
+_COVERAGE_QUESTION_RE = re.compile(r"\b(?:cover(?:ed|age|s)?|includ(?:e[ds]?|ing)?)\b", re.IGNORECASE)
+
+# Word tokenizer plus filler words ignored when extracting the subject of
+# a coverage question ("Does the policy cover knee surgery?" → knee, surgery)
+_TOKEN_RE = re.compile(r"\w+")
+_QUESTION_STOPWORDS = frozenset({
+    "the", "this", "that", "does", "are", "is", "was", "will", "can",
+    "what", "which", "how", "any", "for", "and", "with", "under",
+    "there", "policy", "plan", "insurance", "document",
+})
+
+
+def _question_topic_terms(question: str) -> frozenset:
+    """Extract the significant subject terms of a question."""
+    tokens = _TOKEN_RE.findall(question.casefold())
+    return frozenset(
+        token for token in tokens
+        if len(token) > 2
+        and token not in _QUESTION_STOPWORDS
+        and not _COVERAGE_QUESTION_RE.fullmatch(token)
+    )
+
+
+def _deterministic_coverage(question: str, chunk: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Answer an unambiguous coverage question without an LLM call.
+
+    If the question asks about coverage and every coverage statement
+    about the question's subject in the top retrieved chunk agrees on
+    polarity, the evaluation can be synthesized directly. A statement
+    only counts when its sentence contains every topic term of the
+    question as a whole word — "Cosmetic surgery is covered" must not
+    answer a knee-surgery question, and "accidental" must not satisfy
+    "dental". Any ambiguity (no on-topic statement, or mixed
+    positive/negative statements) returns None and falls through to the
+    normal Gemini analysis.
+    """
+    if not _COVERAGE_QUESTION_RE.search(question):
+        return None
+
+    topic_terms = _question_topic_terms(question)
+    if not topic_terms:
+        return None
+
+    text = chunk.get("text", "")
+    text_lower = text.casefold()
+    polarities = set()
+    for match in _COVERAGE_RE.finditer(text):
+        # Only count statements about the question's subject: the
+        # sentence containing the verb must mention ALL topic terms as
+        # whole tokens. One shared generic word ("treatment") is not
+        # enough to ground an LLM-free answer.
+        start = text_lower.rfind(".", 0, match.start()) + 1
+        end = text_lower.find(".", match.end())
+        if end == -1:
+            end = len(text_lower)
+        statement_tokens = frozenset(_TOKEN_RE.findall(text_lower[start:end]))
+        if not topic_terms <= statement_tokens:
+            continue
+        negative = bool(match.group("neg")) or match.group("verb").lower() == "excluded"
+        polarities.add(negative)
+
+    if len(polarities) != 1:
+        return None
+
+    is_covered = not polarities.pop()
+    return {
+        "isCovered": is_covered,
+        "conditions": [],
+        "rationale": (
+            f"The document states this topic {'is' if is_covered else 'is not'} covered: "
+            f"\"{text[:200].strip()}...\""
+        ),
+        "confidence_score": 0.85,
+        "clause_reference": {
+            "page": chunk.get("page"),
+            "clause_title": "Coverage statement"
+        }
+    }
+
+# Static prompt segments built once at import; per-call prompts are a
+# plain three-part concatenation instead of re-running a multi-kilobyte
+# f-string. The segments are unindented to avoid shipping leading
+# whitespace as input tokens to Gemini.
+_FAST_PROMPT_PREFIX = """Based on the document content below, answer this question directly and clearly.
+
+Question: """
+
+_FAST_PROMPT_MIDDLE = """
+
+Document Content:
+"""
+
+_FAST_PROMPT_SUFFIX = """
+
+Provide a JSON response with this exact format:
+{
+    "isCovered": true,
+    "conditions": ["condition 1", "condition 2"],
+    "rationale": "Clear explanation based on the document",
+    "confidence_score": 0.9,
+    "clause_reference": {"page": 1, "clause_title": "Section Name"}
+}
+
+Guidelines:
+- Answer based ONLY on what's explicitly stated in the document
+- If coverage exists, set isCovered to true and list any conditions
+- If no coverage found, set isCovered to false
+- Provide a clear rationale explaining your answer
+- Set confidence between 0.7-0.95 based on clarity of information"""
+
+_CHUNK_PROMPT_PREFIX = """You are analyzing an insurance policy document. Answer this question based on the document content provided.
+
+Question: """
+
+_CHUNK_PROMPT_MIDDLE = """
+
+Document Content:
+"""
+
+_CHUNK_PROMPT_SUFFIX = """
+
+Instructions:
+- Read the document content carefully
+- Answer based ONLY on what's explicitly stated
+- If the document covers the topic, explain the coverage and any conditions
+- If not covered, clearly state it's not covered
+- Be specific about waiting periods, conditions, or limitations
+
+Provide your answer in this JSON format:
+{
+    "isCovered": true,
+    "conditions": ["specific condition 1", "specific condition 2"],
+    "rationale": "Clear explanation based on the document text",
+    "confidence_score": 0.9,
+    "clause_reference": {"page": 1, "clause_title": "Relevant Section"}
+}"""
+
+
+def _truncated_context(texts, max_chars: int) -> str:
+    """Join chunk texts under a total character budget.
+
+    The budget is split evenly across chunks so a single oversized chunk
+    can't crowd out the rest; keeps LLM input tokens (latency and cost)
+    bounded regardless of chunk sizes.
+    """
+    texts = list(texts)
+    if not texts:
+        return ""
+    per_chunk = max_chars // len(texts)
+    return "\n\n".join(text[:per_chunk] for text in texts)
+
+
+def _parse_llm_json(response: str):
+    """Parse a (possibly fenced) JSON response from the LLM.
+
+    orjson's C parser handles the common case; stdlib json is the
+    fallback for inputs orjson rejects, so callers still see
+    json.JSONDecodeError on genuinely malformed output.
+    """
+    cleaned = _FENCE_RE.sub("", response).strip()
+    try:
+        return orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
+        return json.loads(cleaned)
+
+# Template for per-answer metadata; the model fields are constant per
+# process, so answers clone it with model_copy instead of re-validating.
+_pm_template: ProcessingMetadata = None
+
+
+def _metadata_template(settings) -> ProcessingMetadata:
+    """Get the cached ProcessingMetadata template for this process."""
+    global _pm_template
+    if _pm_template is None:
+        _pm_template = ProcessingMetadata(
+            model_used=settings.llm_model,
+            embedding_model=settings.embedding_model,
+            chunks_analyzed=0,
+            total_tokens=None
+        )
+    return _pm_template
+
+
+# Chunks of documents already processed this process, keyed by document
+# ID; repeat requests for the same URL skip download/chunk/store entirely.
+_DOCUMENT_CACHE_MAX = 32
+_processed_documents: "OrderedDict[str, List]" = OrderedDict()
+
+
+@lru_cache(maxsize=1024)
+def _document_id(document_url: str) -> str:
+    """Stable content-addressed document ID for a blob URL.
+
+    Python's built-in hash() is randomized per process, which made IDs
+    differ across workers and restarts and defeated vector-store reuse;
+    blake2b gives the same ID for the same URL everywhere.
+    """
+    return f"doc_{hashlib.blake2b(document_url.encode(), digest_size=16).hexdigest()}"
+
+
+async def bind_services(app) -> None:
+    """Instantiate service singletons at startup and attach to app.state.
+
+    Keeps the request hot path free of factory calls and guarantees the
+    Gemini client is constructed (connection pools warm) before traffic.
+    The retrieval engine needs Pinecone, so its failure is tolerated and
+    retried lazily on first use.
+    """
+    app.state.settings = get_settings()
+    app.state.doc_processor = get_document_processor()
+    app.state.gemini_client = get_gemini_client()
+    app.state.decision_engine = get_decision_engine()
+    # One semaphore for the process: bounds in-flight Gemini calls across
+    # ALL concurrent requests (quota protection), not just within one.
+    app.state.gemini_semaphore = asyncio.Semaphore(app.state.settings.gemini_concurrency)
+    try:
+        app.state.retrieval_engine = await get_retrieval_engine()
+    except Exception as e:
+        logger.warning(f"Retrieval engine not ready at startup, will retry on first request: {e}")
+        app.state.retrieval_engine = None
+
 
 @router.post("/hackrx/upload")
 async def upload_document(file: UploadFile = File(...)):
@@ -53,17 +292,7 @@ async def upload_document(file: UploadFile = File(...)):
                     detail=f"Unsupported file type. Allowed types: PDF, DOCX, DOC, TXT"
                 )
 
-        # Validate file size (10MB limit)
-        max_size = 10 * 1024 * 1024  # 10MB
-        content = await file.read()
-
-        if len(content) > max_size:
-            raise HTTPException(
-                status_code=400,
-                detail="File size exceeds 10MB limit"
-            )
-
-        # Create temporary file
+        # Determine temp-file suffix before streaming
         suffix = allowed_types.get(file.content_type, '.tmp')
         if suffix == '.tmp' and file.filename:
             # Try to get extension from filename
@@ -71,9 +300,24 @@ async def upload_document(file: UploadFile = File(...)):
             if ext in ['.pdf', '.docx', '.doc', '.txt']:
                 suffix = ext
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
+        # Stream the upload to disk in 64KB chunks instead of buffering
+        # the whole file in memory; size is validated as bytes arrive.
+        max_size = 10 * 1024 * 1024  # 10MB
+        total_size = 0
+
+        # aiofiles moves each disk write onto its thread pool so a slow
+        # disk doesn't stall the event loop for concurrent requests
+        async with aiofiles.tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
+            temp_file_path = str(temp_file.name)
+            while chunk := await file.read(64 * 1024):
+                total_size += len(chunk)
+                if total_size > max_size:
+                    os.unlink(temp_file_path)
+                    raise HTTPException(
+                        status_code=400,
+                        detail="File size exceeds 10MB limit"
+                    )
+                await temp_file.write(chunk)
 
         # Create a file URL that the backend can access
         file_url = f"file://{temp_file_path}"
@@ -84,7 +328,7 @@ async def upload_document(file: UploadFile = File(...)):
             "success": True,
             "file_url": file_url,
             "filename": file.filename,
-            "size": len(content),
+            "size": total_size,
             "content_type": file.content_type,
             "message": "File uploaded successfully"
         }
@@ -100,105 +344,90 @@ async def upload_document(file: UploadFile = File(...)):
 
 
 @router.post("/hackrx/run", response_model=QueryResponse)
-async def process_queries(request: QueryRequest) -> QueryResponse:
+async def process_queries(request: QueryRequest, fastapi_request: Request) -> QueryResponse:
     """
     Process queries against a document using LLM-powered analysis.
-    
+
     This endpoint:
     1. Downloads and processes the document from the blob URL
     2. Analyzes each question using Gemini AI
     3. Returns structured responses with explainability
     """
-    start_time = time.time()
-    settings = get_settings()
-    
+    start_time = time.perf_counter()  # monotonic; not a wall-clock timestamp
+    state = fastapi_request.app.state
+    settings = state.settings
+
     try:
         logger.info(f"Processing {len(request.questions)} questions for document: {request.documents}")
-        
-        # Initialize services
-        doc_processor = get_document_processor()
-        retrieval_engine = await get_retrieval_engine()
-        decision_engine = get_decision_engine()
-        gemini_client = get_gemini_client()
 
-        # Step 1: Process the document
-        logger.info("Step 1: Processing document...")
-        document_chunks = await doc_processor.process_blob_url(request.documents)
+        retrieval_engine, document_id, document_chunks = await prepare_document(request, state)
+        decision_engine = state.decision_engine
+        gemini_client = state.gemini_client
 
-        if not document_chunks:
-            raise HTTPException(
-                status_code=400,
-                detail="Failed to extract content from the provided document"
-            )
 
-        logger.info(f"Document processed: {len(document_chunks)} chunks extracted")
+        # Step 3: Process all questions concurrently (each is independent
+        # LLM/vector I/O); the shared app-level semaphore bounds in-flight
+        # Gemini calls across all concurrent requests.
+        logger.debug("Step 3: Processing questions...")
+        semaphore = state.gemini_semaphore
+        # Per-request fan-out bound: one large request can't occupy the
+        # whole shared Gemini budget and starve concurrent requests
+        question_semaphore = asyncio.Semaphore(settings.max_concurrent_questions)
 
-        # Step 2: Store document in vector store
-        logger.info("Step 2: Storing document in vector store...")
-        document_id = f"doc_{hash(request.documents)}"  # Simple document ID
-        storage_result = await retrieval_engine.store_document(document_chunks, document_id)
+        # Preferred path: retrieve chunks per question in parallel, then
+        # evaluate all questions in one fused Gemini call.
+        if len(request.questions) > 1:
+            try:
+                answers = await process_questions_batched(
+                    request.questions, document_id, retrieval_engine,
+                    gemini_client, settings, semaphore
+                )
+                successful_responses = len(answers)
+                return build_query_response(
+                    request, answers, successful_responses, document_chunks, start_time
+                )
+            except Exception as e:
+                logger.warning(f"Batched evaluation failed, falling back to per-question analysis: {e}")
 
-        if not storage_result["success"]:
-            logger.warning(f"Partial storage success: {storage_result}")
+        async def process_bounded(question: str) -> QueryAnswer:
+            async with question_semaphore, semaphore:
+                return await process_single_question(
+                    question, document_id, document_chunks,
+                    retrieval_engine, decision_engine, gemini_client, settings
+                )
+
+        results = await asyncio.gather(
+            *(process_bounded(question) for question in request.questions),
+            return_exceptions=True
+        )
 
-        logger.info(f"Document stored: {storage_result['stored_chunks']} chunks in vector store")
-        
-        # Step 3: Process each question
-        logger.info("Step 3: Processing questions...")
         answers = []
         successful_responses = 0
 
-        for question in request.questions:
-            try:
-                answer = await process_single_question(
-                    question, document_id, retrieval_engine, decision_engine, gemini_client, settings
-                )
-                answers.append(answer)
-                successful_responses += 1
-                
-            except Exception as e:
-                logger.error(f"Failed to process question '{question}': {e}")
+        for question, result in zip(request.questions, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to process question '{question}': {result}")
                 # Create error response for this question
-                error_answer = QueryAnswer(
+                answers.append(QueryAnswer(
                     question=question,
                     isCovered=False,
                     conditions=[],
                     clause_reference=ClauseReference(page=None, clause_title="Error"),
-                    rationale=f"Failed to process question due to error: {str(e)}",
+                    rationale=f"Failed to process question due to error: {str(result)}",
                     confidence_score=0.0,
-                    processing_metadata=ProcessingMetadata(
-                        model_used=settings.llm_model,
-                        embedding_model=settings.embedding_model,
-                        chunks_analyzed=0,
-                        total_tokens=0
+                    processing_metadata=_metadata_template(settings).model_copy(
+                        update={"total_tokens": 0}
                     )
-                )
-                answers.append(error_answer)
+                ))
+            else:
+                answers.append(result)
+                successful_responses += 1
         
         # Step 4: Create response summary
-        total_time = time.time() - start_time
-        
-        # Extract document metadata
-        total_pages = None
-        if document_chunks:
-            page_metadata = [chunk.metadata.get('page') for chunk in document_chunks if chunk.metadata.get('page')]
-            if page_metadata:
-                total_pages = max(page_metadata)
-        
-        processing_summary = ProcessingSummary(
-            total_questions=len(request.questions),
-            successful_responses=successful_responses,
-            total_processing_time=f"{total_time:.1f}s",
-            document_pages_processed=total_pages
+        return build_query_response(
+            request, answers, successful_responses, document_chunks, start_time
         )
-        
-        logger.info(f"Processing completed: {successful_responses}/{len(request.questions)} successful in {total_time:.1f}s")
-        
-        return QueryResponse(
-            answers=answers,
-            processing_summary=processing_summary
-        )
-        
+
     except HTTPException:
         raise
     except Exception as e:
@@ -209,9 +438,241 @@ async def process_queries(request: QueryRequest) -> QueryResponse:
         )
 
 
+async def prepare_document(request: QueryRequest, state):
+    """
+    Download, chunk and store the request's document.
+
+    Shared first half of the batched and streaming endpoints.
+
+    Returns:
+        Tuple of (retrieval_engine, document_id, document_chunks)
+    """
+    # Services were bound to app.state at startup; the retrieval
+    # engine may need a lazy retry if Pinecone wasn't ready then.
+    retrieval_engine = state.retrieval_engine
+    if retrieval_engine is None:
+        retrieval_engine = await get_retrieval_engine()
+        state.retrieval_engine = retrieval_engine
+
+    document_id = _document_id(request.documents)
+
+    # Repeat document: chunks and vectors are already stored, skip the
+    # download/chunk/embed pipeline entirely.
+    cached_chunks = _processed_documents.get(document_id)
+    if cached_chunks is not None:
+        logger.info(f"Document {document_id} already processed, reusing {len(cached_chunks)} chunks")
+        return retrieval_engine, document_id, cached_chunks
+
+    # Step 1: Process the document
+    logger.debug("Step 1: Processing document...")
+    document_chunks = await state.doc_processor.process_blob_url(request.documents)
+
+    if not document_chunks:
+        raise HTTPException(
+            status_code=400,
+            detail="Failed to extract content from the provided document"
+        )
+
+    logger.info(f"Document processed: {len(document_chunks)} chunks extracted")
+
+    # Step 2: Store document in vector store
+    logger.debug("Step 2: Storing document in vector store...")
+    storage_result = await retrieval_engine.store_document(document_chunks, document_id)
+
+    if not storage_result["success"]:
+        logger.warning(f"Partial storage success: {storage_result}")
+
+    logger.info(f"Document stored: {storage_result['stored_chunks']} chunks in vector store")
+
+    _processed_documents[document_id] = document_chunks
+    while len(_processed_documents) > _DOCUMENT_CACHE_MAX:
+        _processed_documents.popitem(last=False)  # FIFO eviction
+
+    return retrieval_engine, document_id, document_chunks
+
+
+@router.post("/hackrx/run/stream")
+async def process_queries_stream(request: QueryRequest, fastapi_request: Request) -> StreamingResponse:
+    """
+    Process queries and stream each answer as soon as it is ready.
+
+    NDJSON variant of /hackrx/run: one QueryAnswer JSON object per line,
+    emitted in completion order, so clients don't wait on the slowest
+    question before seeing results.
+    """
+    state = fastapi_request.app.state
+    settings = state.settings
+
+    logger.info(f"Streaming {len(request.questions)} questions for document: {request.documents}")
+
+    retrieval_engine, document_id, document_chunks = await prepare_document(request, state)
+    decision_engine = state.decision_engine
+    gemini_client = state.gemini_client
+
+    semaphore = state.gemini_semaphore
+    # Per-request fan-out bound, same as the non-streaming endpoint
+    question_semaphore = asyncio.Semaphore(settings.max_concurrent_questions)
+
+    async def process_bounded(question: str) -> QueryAnswer:
+        async with question_semaphore, semaphore:
+            try:
+                return await process_single_question(
+                    question, document_id, document_chunks,
+                    retrieval_engine, decision_engine, gemini_client, settings
+                )
+            except Exception as e:
+                logger.error(f"Failed to process question '{question}': {e}")
+                return QueryAnswer(
+                    question=question,
+                    isCovered=False,
+                    conditions=[],
+                    clause_reference=ClauseReference(page=None, clause_title="Error"),
+                    rationale=f"Failed to process question due to error: {str(e)}",
+                    confidence_score=0.0,
+                    processing_metadata=_metadata_template(settings).model_copy(
+                        update={"total_tokens": 0}
+                    )
+                )
+
+    tasks = [asyncio.ensure_future(process_bounded(q)) for q in request.questions]
+
+    async def answer_stream():
+        try:
+            for completed in asyncio.as_completed(tasks):
+                answer = await completed
+                yield answer.model_dump_json().encode() + b"\n"
+        finally:
+            # Client disconnects mid-stream shouldn't leak pending tasks
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(answer_stream(), media_type="application/x-ndjson")
+
+
+def build_query_response(
+    request: QueryRequest,
+    answers: List[QueryAnswer],
+    successful_responses: int,
+    document_chunks,
+    start_time: float
+) -> QueryResponse:
+    """Assemble the final QueryResponse with its processing summary."""
+    total_time = time.perf_counter() - start_time
+
+    # Extract document metadata: single-pass max, no intermediate list
+    total_pages = max(
+        (page for chunk in document_chunks or () if (page := chunk.metadata.get('page'))),
+        default=None
+    )
+
+    processing_summary = ProcessingSummary(
+        total_questions=len(request.questions),
+        successful_responses=successful_responses,
+        total_processing_time=f"{total_time:.1f}s",
+        document_pages_processed=total_pages
+    )
+
+    logger.info(f"Processing completed: {successful_responses}/{len(request.questions)} successful in {total_time:.1f}s")
+
+    return QueryResponse(
+        answers=answers,
+        processing_summary=processing_summary
+    )
+
+
+async def retrieve_chunks_for_question(
+    question: str,
+    document_id: str,
+    retrieval_engine,
+    settings
+) -> List[Dict[str, Any]]:
+    """Retrieve (and if needed rerank) the relevant chunks for one question."""
+    relevant_chunks = await retrieval_engine.retrieve_relevant_chunks(
+        query=question,
+        document_id=document_id,
+        use_hybrid_search=True
+    )
+
+    if len(relevant_chunks) > settings.rerank_top_k:
+        logger.debug(f"Reranking {len(relevant_chunks)} chunks...")
+        relevant_chunks = await retrieval_engine.rerank_chunks(question, relevant_chunks)
+
+    return relevant_chunks
+
+
+async def process_questions_batched(
+    questions: List[str],
+    document_id: str,
+    retrieval_engine,
+    gemini_client,
+    settings,
+    semaphore: asyncio.Semaphore
+) -> List[QueryAnswer]:
+    """
+    Process all questions with one fused Gemini evaluation call.
+
+    Retrieval still runs per question (bounded by the semaphore), but the
+    N coverage evaluations collapse into a single LLM round-trip.
+    """
+    async def retrieve_bounded(question: str):
+        async with semaphore:
+            return await retrieve_chunks_for_question(
+                question, document_id, retrieval_engine, settings
+            )
+
+    chunks_per_question = await asyncio.gather(
+        *(retrieve_bounded(question) for question in questions)
+    )
+
+    evaluations = await gemini_client.evaluate_coverage_batch(
+        questions,
+        [chunks[:3] for chunks in chunks_per_question]
+    )
+
+    return [
+        build_query_answer(question, evaluation, len(chunks), settings)
+        for question, evaluation, chunks in zip(questions, evaluations, chunks_per_question)
+    ]
+
+
+def build_query_answer(
+    question: str,
+    evaluation: Dict[str, Any],
+    chunks_analyzed: int,
+    settings
+) -> QueryAnswer:
+    """Build a structured QueryAnswer from an evaluation dict."""
+    answer = QueryAnswer(
+        question=question,
+        isCovered=evaluation.get("isCovered", False),
+        conditions=evaluation.get("conditions", []) + evaluation.get("limitations", []),
+        clause_reference=ClauseReference(
+            page=evaluation.get("clause_reference", {}).get("page"),
+            clause_title=evaluation.get("clause_reference", {}).get("clause_title")
+        ),
+        rationale=evaluation.get("rationale", "No rationale provided"),
+        confidence_score=evaluation.get("confidence_score", 0.0),
+        # total_tokens stays None until actual token usage is populated
+        processing_metadata=_metadata_template(settings).model_copy(
+            update={"chunks_analyzed": chunks_analyzed}
+        )
+    )
+
+    # Add advanced analysis metadata to rationale if available
+    if evaluation.get("evidence_strength"):
+        answer.rationale += f" [Evidence: {evaluation['evidence_strength']}]"
+    if evaluation.get("completeness"):
+        answer.rationale += f" [Completeness: {evaluation['completeness']}]"
+    if evaluation.get("contradictions"):
+        answer.rationale += f" [Contradictions found: {len(evaluation['contradictions'])}]"
+
+    return answer
+
+
 async def process_single_question(
     question: str,
     document_id: str,
+    document_chunks,
     retrieval_engine,
     decision_engine,
     gemini_client,
@@ -223,6 +684,7 @@ async def process_single_question(
     Args:
         question: The question to process
         document_id: Document identifier for filtering
+        document_chunks: Already-extracted chunks, used when retrieval is empty
         retrieval_engine: Retrieval engine instance
         decision_engine: Advanced decision engine
         gemini_client: Gemini AI client
@@ -232,61 +694,51 @@ async def process_single_question(
         QueryAnswer with the analysis results
     """
     try:
+        # Step 0: Semantic cache — similar questions against the same
+        # document skip the whole retrieval + LLM pipeline.
+        semantic_cache = get_semantic_cache()
+        cached_answer = semantic_cache.get(document_id, question)
+        if cached_answer is not None:
+            return cached_answer.model_copy(update={"question": question})
+
         # Step 1: Analyze the question to understand intent
-        logger.debug(f"Analyzing question: {question}")
+        # Template-style args defer formatting until the DEBUG level is enabled
+        logger.debug("Analyzing question: {}", question)
         query_analysis = await gemini_client.analyze_query(question)
 
-        # Step 2: Retrieve relevant chunks using vector search
-        logger.debug(f"Retrieving relevant chunks for: {question[:50]}...")
-        relevant_chunks = await retrieval_engine.retrieve_relevant_chunks(
-            query=question,
-            document_id=document_id,
-            use_hybrid_search=True
+        # Step 2/3: Retrieve relevant chunks and rerank when needed
+        logger.opt(lazy=True).debug("Retrieving relevant chunks for: {}...", lambda: question[:50])
+        relevant_chunks = await retrieve_chunks_for_question(
+            question, document_id, retrieval_engine, settings
         )
 
-        # Step 3: Rerank chunks using LLM
-        if len(relevant_chunks) > settings.rerank_top_k:
-            logger.debug(f"Reranking {len(relevant_chunks)} chunks...")
-            relevant_chunks = await retrieval_engine.rerank_chunks(question, relevant_chunks)
-
         # Step 4: Simplified fast analysis
-        logger.debug(f"Performing fast analysis with {len(relevant_chunks)} relevant chunks")
+        logger.opt(lazy=True).debug("Performing fast analysis with {} relevant chunks", lambda: len(relevant_chunks))
 
-        # If no relevant chunks found, use the original document chunks
+        # The retrieval engine falls back to its keyword index internally,
+        # so an empty result here means the document has no match at all;
+        # analyze the leading already-extracted chunks rather than nothing.
+        deterministic = False
         if not relevant_chunks:
-            logger.warning("No relevant chunks found, using original document chunks")
-            # Use the original processed chunks directly
-            evaluation = await perform_fast_analysis_with_chunks(question, chunks[:3], gemini_client)
-        else:
-            evaluation = await perform_fast_analysis(question, relevant_chunks, gemini_client)
-        
-        # Step 5: Create enhanced structured response
-        answer = QueryAnswer(
-            question=question,
-            isCovered=evaluation.get("isCovered", False),
-            conditions=evaluation.get("conditions", []) + evaluation.get("limitations", []),
-            clause_reference=ClauseReference(
-                page=evaluation.get("clause_reference", {}).get("page"),
-                clause_title=evaluation.get("clause_reference", {}).get("clause_title")
-            ),
-            rationale=evaluation.get("rationale", "No rationale provided"),
-            confidence_score=evaluation.get("confidence_score", 0.0),
-            processing_metadata=ProcessingMetadata(
-                model_used=settings.llm_model,
-                embedding_model=settings.embedding_model,
-                chunks_analyzed=len(relevant_chunks),
-                total_tokens=None  # Would be populated with actual token usage
+            logger.warning("No relevant chunks found for question, using leading document chunks")
+            evaluation = await perform_fast_analysis_with_chunks(
+                question, document_chunks[:3], gemini_client
             )
-        )
+        else:
+            # Trivially-answered coverage questions skip the LLM entirely
+            evaluation = _deterministic_coverage(question, relevant_chunks[0])
+            if evaluation is None:
+                evaluation = await perform_fast_analysis(question, relevant_chunks, gemini_client)
+            else:
+                deterministic = True
+                logger.debug("Answered deterministically without LLM: {}", question)
 
-        # Add advanced analysis metadata to rationale if available
-        if evaluation.get("evidence_strength"):
-            answer.rationale += f" [Evidence: {evaluation['evidence_strength']}]"
-        if evaluation.get("completeness"):
-            answer.rationale += f" [Completeness: {evaluation['completeness']}]"
-        if evaluation.get("contradictions"):
-            answer.rationale += f" [Contradictions found: {len(evaluation['contradictions'])}]"
-        
+        # Step 5: Create enhanced structured response
+        answer = build_query_answer(question, evaluation, len(relevant_chunks), settings)
+        # Heuristic answers stay out of the semantic cache so they can't
+        # propagate to merely similar questions
+        if not deterministic:
+            semantic_cache.put(document_id, question, answer)
         return answer
         
     except Exception as e:
@@ -311,40 +763,25 @@ async def perform_fast_analysis(question: str, chunks: List[Dict], gemini_client
         Analysis result
     """
     try:
-        # Combine top chunks for context
-        context_text = "\n\n".join([chunk.get('text', '') for chunk in chunks[:3]])
-
-        # Simple, direct analysis prompt
-        analysis_prompt = f"""
-        Based on the document content below, answer this question directly and clearly.
-
-        Question: {question}
-
-        Document Content:
-        {context_text}
-
-        Provide a JSON response with this exact format:
-        {{
-            "isCovered": true,
-            "conditions": ["condition 1", "condition 2"],
-            "rationale": "Clear explanation based on the document",
-            "confidence_score": 0.9,
-            "clause_reference": {{"page": 1, "clause_title": "Section Name"}}
-        }}
-
-        Guidelines:
-        - Answer based ONLY on what's explicitly stated in the document
-        - If coverage exists, set isCovered to true and list any conditions
-        - If no coverage found, set isCovered to false
-        - Provide a clear rationale explaining your answer
-        - Set confidence between 0.7-0.95 based on clarity of information
-        """
+        # Combine top chunks for context (itemgetter keeps the per-chunk
+        # field access in C; retrieval results always carry 'text'),
+        # capped to the configured context budget
+        context_text = _truncated_context(
+            map(itemgetter('text'), chunks[:3]),
+            get_settings().max_context_chars
+        )
+
+        # Simple, direct analysis prompt (static segments pre-built)
+        analysis_prompt = (
+            _FAST_PROMPT_PREFIX + question + _FAST_PROMPT_MIDDLE
+            + context_text + _FAST_PROMPT_SUFFIX
+        )
 
         response = await gemini_client.generate_content(analysis_prompt)
 
         try:
             # Try to parse JSON response
-            result = json.loads(response.strip())
+            result = _parse_llm_json(response)
 
             # Validate required fields
             if "isCovered" not in result:
@@ -358,7 +795,7 @@ async def perform_fast_analysis(question: str, chunks: List[Dict], gemini_client
             if "clause_reference" not in result:
                 result["clause_reference"] = {"page": 1, "clause_title": "Document"}
 
-            logger.info(f"Fast analysis completed for: {question}")
+            logger.debug("Fast analysis completed for: {}", question)
             return result
 
         except json.JSONDecodeError:
@@ -366,7 +803,7 @@ async def perform_fast_analysis(question: str, chunks: List[Dict], gemini_client
 
             # Fallback: analyze response text for key indicators
             response_lower = response.lower()
-            is_covered = any(word in response_lower for word in ['yes', 'covered', 'included', 'available'])
+            is_covered = _POSITIVE_RE.search(response_lower) is not None
 
             return {
                 "isCovered": is_covered,
@@ -400,49 +837,27 @@ async def perform_fast_analysis_with_chunks(question: str, chunks, gemini_client
         Analysis result
     """
     try:
-        # Extract text from DocumentChunk objects
+        # Extract text from DocumentChunk objects, capped to the
+        # configured context budget
         if chunks and hasattr(chunks[0], 'text'):
-            context_text = "\n\n".join([chunk.text for chunk in chunks])
+            context_text = _truncated_context(
+                map(attrgetter('text'), chunks),
+                get_settings().max_context_chars
+            )
         else:
             context_text = "No document content available"
 
-        # Simple, direct analysis prompt
-        analysis_prompt = f"""
-        You are analyzing an insurance policy document. Answer this question based on the document content provided.
-
-        Question: {question}
-
-        Document Content:
-        {context_text}
-
-        Instructions:
-        - Read the document content carefully
-        - Answer based ONLY on what's explicitly stated
-        - If the document covers the topic, explain the coverage and any conditions
-        - If not covered, clearly state it's not covered
-        - Be specific about waiting periods, conditions, or limitations
-
-        Provide your answer in this JSON format:
-        {{
-            "isCovered": true,
-            "conditions": ["specific condition 1", "specific condition 2"],
-            "rationale": "Clear explanation based on the document text",
-            "confidence_score": 0.9,
-            "clause_reference": {{"page": 1, "clause_title": "Relevant Section"}}
-        }}
-        """
+        # Simple, direct analysis prompt (static segments pre-built)
+        analysis_prompt = (
+            _CHUNK_PROMPT_PREFIX + question + _CHUNK_PROMPT_MIDDLE
+            + context_text + _CHUNK_PROMPT_SUFFIX
+        )
 
         response = await gemini_client.generate_content(analysis_prompt)
 
         try:
-            # Clean the response to extract JSON
-            response_clean = response.strip()
-            if response_clean.startswith('```json'):
-                response_clean = response_clean[7:]
-            if response_clean.endswith('```'):
-                response_clean = response_clean[:-3]
-
-            result = json.loads(response_clean.strip())
+            # Strip code fences and parse in one pass
+            result = _parse_llm_json(response)
 
             # Validate and fix required fields
             if "isCovered" not in result:
@@ -456,7 +871,7 @@ async def perform_fast_analysis_with_chunks(question: str, chunks, gemini_client
             if "clause_reference" not in result:
                 result["clause_reference"] = {"page": 1, "clause_title": "Document"}
 
-            logger.info(f"Fast analysis with chunks completed for: {question}")
+            logger.debug("Fast analysis with chunks completed for: {}", question)
             return result
 
         except json.JSONDecodeError:
@@ -465,16 +880,11 @@ async def perform_fast_analysis_with_chunks(question: str, chunks, gemini_client
             # Fallback: analyze response text for key indicators
             response_lower = response.lower()
 
-            # Look for coverage indicators
-            is_covered = any(word in response_lower for word in [
-                'yes', 'covered', 'included', 'available', 'provided', 'benefits'
-            ])
-
-            # Look for negative indicators
-            if any(word in response_lower for word in [
-                'not covered', 'excluded', 'not included', 'no coverage', 'not available'
-            ]):
-                is_covered = False
+            # Positive indicators, overridden by any negative indicator
+            is_covered = (
+                _POSITIVE_RE.search(response_lower) is not None
+                and _NEGATIVE_RE.search(response_lower) is None
+            )
 
             # Extract conditions from response
             conditions = []
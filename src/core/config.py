@@ -1,6 +1,7 @@
 """Configuration management for the Intelligent Query Retrieval System."""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -31,9 +32,15 @@ class Settings(BaseSettings):
     max_retrieval_results: int = Field(default=10, env="MAX_RETRIEVAL_RESULTS")  # Reduced for speed
     rerank_top_k: int = Field(default=3, env="RERANK_TOP_K")  # Reduced for speed
     max_document_size_mb: int = Field(default=50, env="MAX_DOCUMENT_SIZE_MB")
+    max_context_chars: int = Field(default=24000, env="MAX_CONTEXT_CHARS")  # LLM prompt context budget
     
     # API Configuration
     max_questions_per_request: int = Field(default=10, env="MAX_QUESTIONS_PER_REQUEST")
+    max_concurrent_questions: int = Field(default=5, env="MAX_CONCURRENT_QUESTIONS")  # per-request question fan-out
+    gemini_concurrency: int = Field(default=8, env="GEMINI_CONCURRENCY")  # process-wide LLM call bound
+    embed_concurrency: int = Field(default=10, env="EMBED_CONCURRENCY")  # in-flight embedding calls
+    validation_confidence_threshold: float = Field(default=0.85, env="VALIDATION_CONFIDENCE_THRESHOLD")
+    multistep_reasoning: bool = Field(default=False, env="MULTISTEP_REASONING")  # A/B: multi-call decision pipeline
     request_timeout_seconds: int = Field(default=300, env="REQUEST_TIMEOUT_SECONDS")
     
     # Cache Configuration
@@ -49,10 +56,11 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-# Global settings instance
-settings = Settings()
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
+    """Get application settings (constructed once per process).
+
+    The lru_cache means the .env file and environment are parsed exactly
+    once; changing the environment requires a process restart.
+    """
+    return Settings()
@@ -1,21 +1,109 @@
 """Gemini AI client for embeddings and language model operations."""
 
 import asyncio
-from typing import List, Dict, Any, Optional
+import atexit
+import hashlib
+import json
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import List, Dict, Any, Optional, Tuple
 from google import genai
 from google.genai import types
 from loguru import logger
 
 from .config import get_settings
 
+# Static prompt segments built once at import; per-call prompts are plain
+# concatenations, and the segments carry no indentation to ship as tokens.
+_ANALYZE_QUERY_PREFIX = """Analyze the following query and extract key information:
+
+Query: \""""
+
+_ANALYZE_QUERY_MIDDLE = """\"
+Context: """
+
+_ANALYZE_QUERY_SUFFIX = """
+
+Please provide a JSON response with the following structure:
+{
+    "intent": "The main intent of the query (e.g., 'coverage_check', 'condition_inquiry', 'policy_details')",
+    "entities": ["List of important entities mentioned (e.g., 'knee surgery', 'maternity', 'waiting period')"],
+    "domain": "The likely domain (insurance, legal, hr, compliance)",
+    "question_type": "Type of question (yes_no, conditional, informational)",
+    "key_terms": ["Important terms for semantic search"]
+}
+
+Respond only with valid JSON."""
+
+_EVALUATE_PREFIX = """Based on the following document chunks, analyze the query and provide a structured response.
+
+Query: \""""
+
+_EVALUATE_MIDDLE = """\"
+
+Document Context:
+"""
+
+_EVALUATE_SUFFIX = """
+
+Please provide a JSON response with the following structure:
+{
+    "isCovered": true/false,
+    "conditions": ["List of conditions or requirements if any"],
+    "clause_reference": {
+        "page": "Page number where relevant clause is found",
+        "clause_title": "Title or description of the relevant clause"
+    },
+    "rationale": "Clear explanation of the decision and reasoning",
+    "confidence_score": 0.0-1.0
+}
+
+Guidelines:
+- Set isCovered to true only if the document explicitly covers the queried topic
+- Include all relevant conditions or limitations
+- Provide clear rationale with specific references to the document
+- Assign confidence score based on clarity and explicitness of the information
+
+Respond only with valid JSON."""
+
+
+def _parse_json(text: str):
+    """Parse a JSON model response with orjson, stdlib json as fallback.
+
+    orjson's C parser is several times faster on the large evaluation
+    payloads; the fallback keeps json.JSONDecodeError semantics for
+    callers that catch it.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text.strip())
+
 
 class GeminiClient:
     """Client for interacting with Google Gemini AI services."""
 
+    # Bounded FIFO cache of analyze_query results (questions often repeat)
+    _ANALYZE_CACHE_MAX = 1024
+    # Bounded LRU cache of text embeddings (chunks/queries recur heavily)
+    _EMBED_CACHE_MAX = 10000
+
     def __init__(self):
         """Initialize the Gemini client."""
         self.settings = get_settings()
         self._client = None
+        # Maps question -> asyncio.Task so concurrent duplicates share one
+        # in-flight call instead of stampeding the API.
+        self._analyze_cache: "OrderedDict[Tuple[str, str], asyncio.Task]" = OrderedDict()
+        # Maps sha256(model + task_type + text) -> embedding vector
+        self._embed_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        # Dedicated executor for SDK calls: bounded, named threads with
+        # stable per-thread HTTP connection reuse, independent of
+        # whatever else shares the loop's default executor.
+        self._executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="gemini")
+        atexit.register(self._executor.shutdown, wait=False)
         self._configure_client()
 
     def _configure_client(self):
@@ -35,10 +123,19 @@ class GeminiClient:
             self._configure_client()
         return self._client
     
+    def _embed_cache_key(self, text: str, task_type: str) -> bytes:
+        """Content-hash cache key; includes model and task_type so vectors
+        from different models/tasks can't collide."""
+        payload = f"{self.settings.embedding_model}\0{task_type}\0{text}"
+        return hashlib.sha256(payload.encode()).digest()
+
     async def generate_embeddings(self, texts: List[str], task_type: str = "retrieval_document") -> List[List[float]]:
         """
         Generate embeddings for a list of texts using Gemini text-embedding-004.
 
+        Previously embedded texts are served from a bounded LRU cache
+        (keyed by content hash), so only unseen texts hit the API.
+
         Args:
             texts: List of text strings to embed
             task_type: Type of task for embedding optimization
@@ -47,37 +144,78 @@ class GeminiClient:
             List of embedding vectors
         """
         try:
-            embeddings = []
+            # Partition into cache hits and misses, preserving order
+            keys = [self._embed_cache_key(text, task_type) for text in texts]
+            vectors: List[Optional[List[float]]] = []
+            miss_indices: List[int] = []
+            for idx, key in enumerate(keys):
+                cached = self._embed_cache.get(key)
+                if cached is not None:
+                    self._embed_cache.move_to_end(key)  # LRU freshness
+                    vectors.append(cached)
+                else:
+                    vectors.append(None)
+                    miss_indices.append(idx)
+
+            if not miss_indices:
+                logger.info(f"Served {len(texts)} embeddings from cache")
+                return vectors
 
-            # Process texts in batches to avoid rate limits
-            batch_size = 10
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i:i + batch_size]
-                batch_embeddings = []
+            loop = asyncio.get_event_loop()
+            # Cap in-flight embedding requests so fan-out can't trip 429s
+            semaphore = asyncio.Semaphore(self.settings.embed_concurrency)
 
-                for text in batch:
+            async def embed_batch(batch: List[str]):
+                async with semaphore:
                     # Run embedding generation in thread pool to avoid blocking
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(
-                        None,
-                        lambda t=text: self.client.models.embed_content(
+                    return await loop.run_in_executor(
+                        self._executor,
+                        partial(
+                            self.client.models.embed_content,
                             model=self.settings.embedding_model,
-                            contents=t,
+                            contents=batch,
                             config=types.EmbedContentConfig(
                                 task_type=task_type
                             )
                         )
                     )
-                    batch_embeddings.append(result.embeddings[0].values)
 
-                embeddings.extend(batch_embeddings)
+            # Deduplicate misses (repeated headers/footers are common in
+            # real PDFs) so each distinct text is embedded exactly once.
+            unique_misses: "OrderedDict[bytes, List[int]]" = OrderedDict()
+            for idx in miss_indices:
+                unique_misses.setdefault(keys[idx], []).append(idx)
+            miss_texts = [texts[indices[0]] for indices in unique_misses.values()]
 
-                # Small delay between batches to respect rate limits
-                if i + batch_size < len(texts):
-                    await asyncio.sleep(0.1)
+            # The embedding API accepts a list of contents per request, so
+            # each HTTP round-trip carries up to 100 texts (the documented
+            # text-embedding-004 maximum) and the batches run concurrently.
+            batch_size = 100
+            batches = [
+                miss_texts[i:i + batch_size]
+                for i in range(0, len(miss_texts), batch_size)
+            ]
+            results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+            miss_vectors: List[List[float]] = [
+                embedding.values
+                for result in results
+                for embedding in result.embeddings
+            ]
 
-            logger.info(f"Generated embeddings for {len(texts)} texts")
-            return embeddings
+            # Scatter computed vectors back in input order and cache them
+            for (key, indices), vector in zip(unique_misses.items(), miss_vectors):
+                for idx in indices:
+                    vectors[idx] = vector
+                self._embed_cache[key] = vector
+            while len(self._embed_cache) > self._EMBED_CACHE_MAX:
+                self._embed_cache.popitem(last=False)
+
+            logger.info(
+                f"Generated embeddings for {len(texts)} texts "
+                f"({len(miss_texts)} computed, {len(texts) - len(miss_indices)} cached, "
+                f"{len(miss_indices) - len(miss_texts)} deduplicated)"
+            )
+            return vectors
 
         except Exception as e:
             logger.error(f"Failed to generate embeddings: {e}")
@@ -98,8 +236,9 @@ class GeminiClient:
             # Run content generation in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
-                None,
-                lambda: self.client.models.generate_content(
+                self._executor,
+                partial(
+                    self.client.models.generate_content,
                     model=self.settings.llm_model,
                     contents=prompt,
                     **kwargs
@@ -113,41 +252,122 @@ class GeminiClient:
             logger.error(f"Failed to generate content: {e}")
             raise
     
+    async def evaluate_coverage_batch(
+        self,
+        questions: List[str],
+        chunks_per_question: List[List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate coverage for multiple questions in a single Gemini call.
+
+        Fusing N questions into one prompt amortizes the network round-trip
+        and model prefill across the whole batch instead of paying it per
+        question.
+
+        Args:
+            questions: The user questions
+            chunks_per_question: Relevant document chunks for each question
+
+        Returns:
+            List of evaluation dicts, one per question, in input order
+
+        Raises:
+            ValueError: If the model response is not a JSON array of length N
+        """
+        question_blocks = []
+        for idx, (question, chunks) in enumerate(zip(questions, chunks_per_question)):
+            context_parts = [
+                f"Chunk {i+1} (Page {chunk.get('page', 'N/A')}):\n{chunk.get('text', '')}"
+                for i, chunk in enumerate(chunks)
+            ]
+            question_blocks.append(
+                f"Question {idx + 1}: \"{question}\"\n"
+                f"Document Context for Question {idx + 1}:\n" + "\n\n".join(context_parts)
+            )
+
+        prompt = f"""
+        For EACH of the {len(questions)} questions below, analyze its document context and produce one JSON object with this structure:
+        {{
+            "isCovered": true/false,
+            "conditions": ["List of conditions or requirements if any"],
+            "clause_reference": {{
+                "page": "Page number where relevant clause is found",
+                "clause_title": "Title or description of the relevant clause"
+            }},
+            "rationale": "Clear explanation of the decision and reasoning",
+            "confidence_score": 0.0-1.0
+        }}
+
+        {chr(10).join(question_blocks)}
+
+        Respond ONLY with a JSON array of exactly {len(questions)} objects, in question order.
+        """
+
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(
+            self._executor,
+            partial(
+                self.client.models.generate_content,
+                model=self.settings.llm_model,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json"
+                )
+            )
+        )
+
+        evaluations = _parse_json(response.text)
+
+        if not isinstance(evaluations, list) or len(evaluations) != len(questions):
+            raise ValueError(
+                f"Batch evaluation returned {len(evaluations) if isinstance(evaluations, list) else type(evaluations)} "
+                f"results for {len(questions)} questions"
+            )
+
+        logger.info(f"Batch-evaluated coverage for {len(questions)} questions in one call")
+        return evaluations
+
     async def analyze_query(self, query: str, context: str = "") -> Dict[str, Any]:
         """
         Analyze a query to extract intent, entities, and other relevant information.
-        
+
+        Results are memoized per (query, context): repeated questions skip
+        the LLM round-trip entirely, and concurrent duplicates await the
+        same in-flight task.
+
         Args:
             query: The user query to analyze
             context: Optional context for better understanding
-            
+
         Returns:
             Dictionary containing analysis results
         """
-        prompt = f"""
-        Analyze the following query and extract key information:
-        
-        Query: "{query}"
-        Context: {context}
-        
-        Please provide a JSON response with the following structure:
-        {{
-            "intent": "The main intent of the query (e.g., 'coverage_check', 'condition_inquiry', 'policy_details')",
-            "entities": ["List of important entities mentioned (e.g., 'knee surgery', 'maternity', 'waiting period')"],
-            "domain": "The likely domain (insurance, legal, hr, compliance)",
-            "question_type": "Type of question (yes_no, conditional, informational)",
-            "key_terms": ["Important terms for semantic search"]
-        }}
-        
-        Respond only with valid JSON.
-        """
-        
+        key = (query, context)
+        task = self._analyze_cache.get(key)
+
+        if task is None or (task.done() and task.exception() is not None):
+            task = asyncio.ensure_future(self._analyze_query_uncached(query, context))
+            self._analyze_cache[key] = task
+            if len(self._analyze_cache) > self._ANALYZE_CACHE_MAX:
+                self._analyze_cache.popitem(last=False)  # FIFO eviction
+
+        return await task
+
+    async def _analyze_query_uncached(self, query: str, context: str = "") -> Dict[str, Any]:
+        """Run the actual query-analysis LLM call (uncached)."""
+        prompt = (
+            _ANALYZE_QUERY_PREFIX + query + _ANALYZE_QUERY_MIDDLE
+            + context + _ANALYZE_QUERY_SUFFIX
+        )
+
+
         try:
             # Use structured output for better JSON parsing
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
-                None,
-                lambda: self.client.models.generate_content(
+                self._executor,
+                partial(
+                    self.client.models.generate_content,
                     model=self.settings.llm_model,
                     contents=prompt,
                     config=types.GenerateContentConfig(
@@ -157,8 +377,7 @@ class GeminiClient:
             )
 
             # Parse JSON response
-            import json
-            analysis = json.loads(response.text.strip())
+            analysis = _parse_json(response.text)
             return analysis
 
         except Exception as e:
@@ -189,42 +408,17 @@ class GeminiClient:
             context_parts.append(f"Chunk {i+1} (Page {chunk.get('page', 'N/A')}):\n{chunk.get('text', '')}")
         
         context = "\n\n".join(context_parts)
-        
-        prompt = f"""
-        Based on the following document chunks, analyze the query and provide a structured response.
-        
-        Query: "{query}"
-        
-        Document Context:
-        {context}
-        
-        Please provide a JSON response with the following structure:
-        {{
-            "isCovered": true/false,
-            "conditions": ["List of conditions or requirements if any"],
-            "clause_reference": {{
-                "page": "Page number where relevant clause is found",
-                "clause_title": "Title or description of the relevant clause"
-            }},
-            "rationale": "Clear explanation of the decision and reasoning",
-            "confidence_score": 0.0-1.0
-        }}
-        
-        Guidelines:
-        - Set isCovered to true only if the document explicitly covers the queried topic
-        - Include all relevant conditions or limitations
-        - Provide clear rationale with specific references to the document
-        - Assign confidence score based on clarity and explicitness of the information
-        
-        Respond only with valid JSON.
-        """
-        
+
+        prompt = _EVALUATE_PREFIX + query + _EVALUATE_MIDDLE + context + _EVALUATE_SUFFIX
+
+
         try:
             # Use structured output for better JSON parsing
             loop = asyncio.get_event_loop()
             response = await loop.run_in_executor(
-                None,
-                lambda: self.client.models.generate_content(
+                self._executor,
+                partial(
+                    self.client.models.generate_content,
                     model=self.settings.llm_model,
                     contents=prompt,
                     config=types.GenerateContentConfig(
@@ -233,8 +427,7 @@ class GeminiClient:
                 )
             )
 
-            import json
-            evaluation = json.loads(response.text.strip())
+            evaluation = _parse_json(response.text)
             return evaluation
 
         except Exception as e:
@@ -249,13 +442,11 @@ class GeminiClient:
             }
 
 
-# Global client instance
-_gemini_client = None
-
-
+@lru_cache(maxsize=1)
 def get_gemini_client() -> GeminiClient:
-    """Get or create the global Gemini client instance."""
-    global _gemini_client
-    if _gemini_client is None:
-        _gemini_client = GeminiClient()
-    return _gemini_client
+    """Get or create the global Gemini client instance.
+
+    lru_cache makes the check-then-set atomic, so racing callers during
+    startup can't each construct a client (and its thread pool).
+    """
+    return GeminiClient()
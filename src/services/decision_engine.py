@@ -2,11 +2,87 @@
 
 import asyncio
 import json
+import orjson
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
+from google.genai import types
 from loguru import logger
 
 from ..core.config import get_settings
 from ..core.gemini_client import get_gemini_client
+from .llm_cache import get_llm_cache
+
+# Static prompt segments built once at import; per-call prompts are plain
+# concatenations instead of re-running multi-kilobyte f-strings, and the
+# segments carry no indentation to ship as input tokens.
+_DECOMPOSE_PREFIX = """Break down this query into 2-3 simple sub-questions. Respond ONLY with a JSON array, no other text.
+
+Query: \""""
+
+_DECOMPOSE_SUFFIX = """\"
+
+Format: ["question 1", "question 2", "question 3"]
+
+Example: ["Is knee surgery covered?", "What are the conditions?", "Are there waiting periods?"]"""
+
+_SUB_QUESTION_PREFIX = """Answer this question based on the document. Respond ONLY with JSON, no other text.
+
+Question: \""""
+
+_SUB_QUESTION_MIDDLE = """\"
+Document: """
+
+_SUB_QUESTION_SUFFIX = """
+
+JSON format:
+{
+    "is_addressed": true,
+    "answer": "direct answer",
+    "confidence": 0.9,
+    "evidence": ["quote from document"]
+}"""
+
+_SYNTHESIS_PREFIX = """Answer the original question based on the sub-analyses. Respond ONLY with JSON, no other text.
+
+Question: \""""
+
+_SYNTHESIS_MIDDLE = """\"
+Sub-analyses: """
+
+_SYNTHESIS_SUFFIX = """
+
+JSON format:
+{
+    "isCovered": true,
+    "conditions": ["condition 1", "condition 2"],
+    "rationale": "explanation",
+    "confidence_score": 0.9,
+    "clause_reference": {"page": 1, "clause_title": "Section Name"}
+}"""
+
+_VALIDATION_PREFIX = """Validate this analysis. Respond ONLY with JSON, no other text.
+
+Analysis: """
+
+_VALIDATION_SUFFIX = """
+
+JSON format:
+{
+    "is_consistent": true,
+    "final_recommendation": "accept"
+}"""
+
+# Shared JSON-mode generation config: constrains the model to emit JSON,
+# removing the prose-wrapper parse failures the fallbacks exist for
+_JSON_CONFIG = types.GenerateContentConfig(response_mime_type="application/json")
+
+
+def _parse_llm_json(text: str):
+    """Parse a JSON model response with orjson, stdlib json as fallback."""
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text.strip())
 
 
 class DecisionEngine:
@@ -34,30 +110,163 @@ class DecisionEngine:
         Returns:
             Comprehensive analysis result
         """
+        # The fused single-call path is the default; the multi-step
+        # pipeline stays available behind a flag for A/B comparison.
+        if not self.settings.multistep_reasoning:
+            return await self.analyze_complex_query_fused(query, retrieved_chunks, domain_context)
+        return await self._analyze_multistep(query, retrieved_chunks, domain_context)
+
+    async def _generate_cached(self, prompt: str, config: Optional[types.GenerateContentConfig] = None) -> str:
+        """Call Gemini through the exact-match response cache.
+
+        Identical prompts (retries, reruns, repeated questions) are
+        answered from the cache without a network round-trip.
+        """
+        cache = get_llm_cache()
+        key = cache.make_key(self.settings.llm_model, prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.gemini_client.generate_content(prompt, config=config)
+        cache.put(key, response)
+        return response
+
+    async def _analyze_multistep(
+        self,
+        query: str,
+        retrieved_chunks: List[Dict[str, Any]],
+        domain_context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the decompose → analyze → synthesize → validate pipeline."""
         try:
             # Step 1: Decompose complex query into sub-questions
             sub_questions = await self._decompose_query(query, domain_context)
             
-            # Step 2: Analyze each sub-question
-            sub_analyses = []
-            for sub_q in sub_questions:
-                analysis = await self._analyze_sub_question(sub_q, retrieved_chunks)
-                sub_analyses.append(analysis)
+            # Prepare the shared chunk context once; every sub-question
+            # call reuses the same joined string instead of re-slicing
+            # and re-joining the chunk texts.
+            chunk_context = "\n\n".join(
+                f"Chunk {i+1}: {chunk.get('text', '')}"
+                for i, chunk in enumerate(retrieved_chunks[:5])
+            )
+
+            # Step 2: Analyze all sub-questions concurrently — each is an
+            # independent Gemini call, so total latency is the slowest
+            # call rather than the sum. _analyze_sub_question returns a
+            # fallback dict on failure, so gather never raises here.
+            semaphore = asyncio.Semaphore(self.settings.gemini_concurrency)
+
+            async def analyze_bounded(sub_q: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await self._analyze_sub_question(sub_q, chunk_context)
+
+            sub_analyses = await asyncio.gather(
+                *(analyze_bounded(sub_q) for sub_q in sub_questions)
+            )
             
             # Step 3: Synthesize results with logical reasoning
             final_analysis = await self._synthesize_analysis(
                 query, sub_questions, sub_analyses, retrieved_chunks
             )
             
-            # Step 4: Validate consistency and detect contradictions
+            # Step 4: Validate consistency and detect contradictions.
+            # High-confidence syntheses without contradictions are rarely
+            # corrected, so they skip the extra LLM round-trip.
+            if (final_analysis.get("confidence_score", 0) >= self.settings.validation_confidence_threshold
+                    and not final_analysis.get("contradictions")):
+                final_analysis["validation"] = {
+                    "is_consistent": True,
+                    "consistency_issues": [],
+                    "validation_confidence": final_analysis["confidence_score"],
+                    "recommendation": "accept"
+                }
+                return final_analysis
+
             validated_analysis = await self._validate_consistency(final_analysis, retrieved_chunks)
-            
+
             return validated_analysis
             
         except Exception as e:
             logger.error(f"Failed to analyze complex query: {e}")
             raise
     
+    async def analyze_complex_query_fused(
+        self,
+        query: str,
+        retrieved_chunks: List[Dict[str, Any]],
+        domain_context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Single-call variant of analyze_complex_query.
+
+        Decomposition, per-sub-question evidence and synthesis are fused
+        into one JSON-mode Gemini call, so the document context is
+        transmitted and prefilled once instead of once per step. Falls
+        back to the multi-step pipeline when the context is too large for
+        a single prompt or the fused response can't be parsed.
+
+        Args:
+            query: The user query
+            retrieved_chunks: Relevant document chunks
+            domain_context: Optional domain-specific context
+
+        Returns:
+            Comprehensive analysis result (same shape as analyze_complex_query)
+        """
+        context = "\n\n".join(
+            f"Chunk {i+1}: {chunk.get('text', '')}"
+            for i, chunk in enumerate(retrieved_chunks[:5])
+        )
+
+        # Oversized contexts go through the multi-step path, which trims
+        # per step rather than risking a truncated fused prompt.
+        if len(context) > self.settings.max_context_chars:
+            return await self._analyze_multistep(query, retrieved_chunks, domain_context)
+
+        fused_prompt = f"""
+        Analyze this query against the document in three steps, then respond ONLY with one JSON object.
+
+        Query: "{query}"
+        Domain: {domain_context or 'general'}
+        Document: {context}
+
+        Steps:
+        1. Break the query into 2-3 sub-questions.
+        2. Answer each sub-question from the document, citing evidence.
+        3. Synthesize a final decision.
+
+        JSON format:
+        {{
+            "sub_questions": ["question 1", "question 2"],
+            "sub_analyses": [
+                {{"sub_question": "question 1", "answer": "direct answer", "confidence": 0.9, "evidence": ["quote from document"]}}
+            ],
+            "isCovered": true,
+            "conditions": ["condition 1", "condition 2"],
+            "rationale": "explanation",
+            "confidence_score": 0.9,
+            "clause_reference": {{"page": 1, "clause_title": "Section Name"}}
+        }}
+        """
+
+        try:
+            response = await self._generate_cached(fused_prompt, config=_JSON_CONFIG)
+            analysis = _parse_llm_json(response)
+            # Shape check: any JSON-parseable response would otherwise be
+            # returned as the analysis (e.g. a bare list), so require the
+            # fields every caller reads before trusting the fused output
+            if not (isinstance(analysis, dict)
+                    and "isCovered" in analysis
+                    and "rationale" in analysis
+                    and "confidence_score" in analysis):
+                raise ValueError("fused response missing required analysis fields")
+            logger.debug("Fused complex analysis completed in one call")
+            return analysis
+        except Exception as e:
+            logger.warning(f"Fused analysis failed ({e}), falling back to multi-step pipeline")
+            return await self._analyze_multistep(query, retrieved_chunks, domain_context)
+
     async def _decompose_query(self, query: str, domain_context: Optional[str] = None) -> List[str]:
         """
         Decompose a complex query into simpler sub-questions.
@@ -70,20 +279,12 @@ class DecisionEngine:
             List of sub-questions
         """
         try:
-            decomposition_prompt = f"""
-            Break down this query into 2-3 simple sub-questions. Respond ONLY with a JSON array, no other text.
-
-            Query: "{query}"
+            decomposition_prompt = _DECOMPOSE_PREFIX + query + _DECOMPOSE_SUFFIX
 
-            Format: ["question 1", "question 2", "question 3"]
-
-            Example: ["Is knee surgery covered?", "What are the conditions?", "Are there waiting periods?"]
-            """
-            
-            response = await self.gemini_client.generate_content(decomposition_prompt)
+            response = await self._generate_cached(decomposition_prompt, config=_JSON_CONFIG)
             
             try:
-                sub_questions = json.loads(response.strip())
+                sub_questions = _parse_llm_json(response)
                 logger.debug(f"Decomposed query into {len(sub_questions)} sub-questions")
                 return sub_questions
             except json.JSONDecodeError:
@@ -95,47 +296,30 @@ class DecisionEngine:
             return [query]
     
     async def _analyze_sub_question(
-        self, 
-        sub_question: str, 
-        retrieved_chunks: List[Dict[str, Any]]
+        self,
+        sub_question: str,
+        chunk_context: str
     ) -> Dict[str, Any]:
         """
         Analyze a single sub-question against document chunks.
-        
+
         Args:
             sub_question: The sub-question to analyze
-            retrieved_chunks: Relevant document chunks
-            
+            chunk_context: Pre-joined context string from the top chunks
+
         Returns:
             Analysis result for the sub-question
         """
         try:
-            # Prepare context from chunks
-            context_parts = []
-            for i, chunk in enumerate(retrieved_chunks[:5]):  # Limit to top 5 chunks
-                context_parts.append(f"Chunk {i+1}: {chunk.get('text', '')}")
-            
-            context = "\n\n".join(context_parts)
-            
-            analysis_prompt = f"""
-            Answer this question based on the document. Respond ONLY with JSON, no other text.
-
-            Question: "{sub_question}"
-            Document: {context}
-
-            JSON format:
-            {{
-                "is_addressed": true,
-                "answer": "direct answer",
-                "confidence": 0.9,
-                "evidence": ["quote from document"]
-            }}
-            """
-            
-            response = await self.gemini_client.generate_content(analysis_prompt)
+            analysis_prompt = (
+                _SUB_QUESTION_PREFIX + sub_question + _SUB_QUESTION_MIDDLE
+                + chunk_context + _SUB_QUESTION_SUFFIX
+            )
+
+            response = await self._generate_cached(analysis_prompt, config=_JSON_CONFIG)
             
             try:
-                analysis = json.loads(response.strip())
+                analysis = _parse_llm_json(response)
                 return analysis
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse sub-question analysis for: {sub_question}")
@@ -182,36 +366,25 @@ class DecisionEngine:
         """
         try:
             # Prepare synthesis context
-            synthesis_context = []
-            for i, analysis in enumerate(sub_analyses):
-                synthesis_context.append(f"""
-                Sub-question {i+1}: {analysis.get('sub_question', '')}
-                Answer: {analysis.get('answer', '')}
-                Evidence: {analysis.get('evidence', [])}
-                Confidence: {analysis.get('confidence', 0.0)}
-                Limitations: {analysis.get('limitations', [])}
-                """)
-            
-            synthesis_prompt = f"""
-            Answer the original question based on the sub-analyses. Respond ONLY with JSON, no other text.
-
-            Question: "{original_query}"
-            Sub-analyses: {chr(10).join(synthesis_context)}
-
-            JSON format:
-            {{
-                "isCovered": true,
-                "conditions": ["condition 1", "condition 2"],
-                "rationale": "explanation",
-                "confidence_score": 0.9,
-                "clause_reference": {{"page": 1, "clause_title": "Section Name"}}
-            }}
-            """
-            
-            response = await self.gemini_client.generate_content(synthesis_prompt)
+            synthesis_context = "\n".join(
+                f"""Sub-question {i+1}: {analysis.get('sub_question', '')}
+Answer: {analysis.get('answer', '')}
+Evidence: {analysis.get('evidence', [])}
+Confidence: {analysis.get('confidence', 0.0)}
+Limitations: {analysis.get('limitations', [])}
+"""
+                for i, analysis in enumerate(sub_analyses)
+            )
+
+            synthesis_prompt = (
+                _SYNTHESIS_PREFIX + original_query + _SYNTHESIS_MIDDLE
+                + synthesis_context + _SYNTHESIS_SUFFIX
+            )
+
+            response = await self._generate_cached(synthesis_prompt, config=_JSON_CONFIG)
             
             try:
-                synthesis = json.loads(response.strip())
+                synthesis = _parse_llm_json(response)
                 logger.debug("Successfully synthesized complex analysis")
                 return synthesis
             except json.JSONDecodeError:
@@ -238,22 +411,16 @@ class DecisionEngine:
             Validated and potentially corrected analysis
         """
         try:
-            validation_prompt = f"""
-            Validate this analysis. Respond ONLY with JSON, no other text.
-
-            Analysis: {json.dumps(analysis, indent=2)}
+            validation_prompt = (
+                _VALIDATION_PREFIX
+                + orjson.dumps(analysis, option=orjson.OPT_INDENT_2).decode()
+                + _VALIDATION_SUFFIX
+            )
 
-            JSON format:
-            {{
-                "is_consistent": true,
-                "final_recommendation": "accept"
-            }}
-            """
-            
-            response = await self.gemini_client.generate_content(validation_prompt)
+            response = await self._generate_cached(validation_prompt, config=_JSON_CONFIG)
             
             try:
-                validation = json.loads(response.strip())
+                validation = _parse_llm_json(response)
                 
                 # Apply corrections if suggested
                 if validation.get("suggested_corrections"):
@@ -347,13 +514,7 @@ class DecisionEngine:
         }
 
 
-# Global decision engine instance
-_decision_engine = None
-
-
+@lru_cache(maxsize=1)
 def get_decision_engine() -> DecisionEngine:
     """Get or create the global decision engine instance."""
-    global _decision_engine
-    if _decision_engine is None:
-        _decision_engine = DecisionEngine()
-    return _decision_engine
+    return DecisionEngine()
@@ -2,8 +2,11 @@
 
 import asyncio
 import aiohttp
-import tempfile
+import atexit
+import io
+import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 try:
@@ -19,13 +22,65 @@ from loguru import logger
 from ..core.config import get_settings
 
 
+# Word tokenizer for the cached per-chunk token set
+_TOKEN_RE = re.compile(r"\w+")
+
+# Sentence boundary: a terminator followed by whitespace and a capital or
+# digit, so decimals ("4.2"), ellipses and lowercase continuations hold
+_SENT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
+
+# Shared pool for page-level PDF text extraction; PyMuPDF releases the
+# GIL inside get_text, so threads scale with cores on large documents
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix="pdf")
+atexit.register(_PDF_EXECUTOR.shutdown, wait=False)
+
+
+def _page_count(content: bytes) -> int:
+    """Open a PDF from bytes and return its page count."""
+    with fitz.open(stream=content, filetype="pdf") as doc:
+        return len(doc)
+
+
+def _extract_page_range(content: bytes, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop) of a PDF.
+
+    Each worker opens its own fitz handle over the shared bytes —
+    PyMuPDF document objects are not thread-safe, but the underlying
+    buffer is, so per-thread handles give safe page-level parallelism.
+    """
+    with fitz.open(stream=content, filetype="pdf") as doc:
+        return [doc.load_page(page_num).get_text() for page_num in range(start, stop)]
+
+
 class DocumentChunk:
-    """Represents a chunk of processed document content."""
-    
+    """Represents a chunk of processed document content.
+
+    Slotted: a large document produces thousands of instances, and
+    dropping the per-instance __dict__ saves a few hundred bytes each.
+    """
+
+    __slots__ = ("text", "metadata", "_text_lower", "_token_set")
+
     def __init__(self, text: str, metadata: Dict[str, Any]):
         self.text = text
         self.metadata = metadata
-    
+        self._text_lower = None
+        self._token_set = None
+
+    @property
+    def text_lower(self) -> str:
+        """Casefolded chunk text, computed once and reused across questions."""
+        if self._text_lower is None:
+            self._text_lower = self.text.casefold()
+        return self._text_lower
+
+    @property
+    def token_set(self) -> frozenset:
+        """Frozen set of word tokens for O(1) keyword membership checks."""
+        if self._token_set is None:
+            self._token_set = frozenset(_TOKEN_RE.findall(self.text_lower))
+        return self._token_set
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert chunk to dictionary format."""
         return {
@@ -41,7 +96,29 @@ class DocumentProcessor:
         """Initialize the document processor."""
         self.settings = get_settings()
         self.supported_formats = {'.pdf', '.docx', '.doc', '.txt'}
-    
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it lazily.
+
+        One pooled session per processor keeps connections (and their
+        TLS handshakes) warm across downloads instead of paying a fresh
+        TCP + TLS setup per document. Created lazily so it binds to the
+        running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=60)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session (called on application shutdown)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
     async def process_blob_url(self, blob_url: str) -> List[DocumentChunk]:
         """
         Process a document from a blob URL or local file URL.
@@ -124,20 +201,27 @@ class DocumentProcessor:
             Tuple of (document_content, content_type)
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(blob_url) as response:
-                    if response.status != 200:
-                        raise Exception(f"Failed to download document: HTTP {response.status}")
-                    
-                    content_type = response.headers.get('content-type', 'application/octet-stream')
-                    content = await response.read()
-                    
-                    # Validate file size
-                    if len(content) > self.settings.max_document_size_mb * 1024 * 1024:
-                        raise Exception(f"Document too large: {len(content)} bytes")
-                    
-                    logger.info(f"Downloaded document: {len(content)} bytes, type: {content_type}")
-                    return content, content_type
+            max_bytes = self.settings.max_document_size_mb * 1024 * 1024
+            session = self._get_session()
+
+            async with session.get(blob_url) as response:
+                if response.status != 200:
+                    raise Exception(f"Failed to download document: HTTP {response.status}")
+
+                content_type = response.headers.get('content-type', 'application/octet-stream')
+
+                # Stream the body and enforce the size limit as bytes
+                # arrive, so oversized documents are aborted early
+                # instead of being buffered whole first
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(65536):
+                    buffer.extend(chunk)
+                    if len(buffer) > max_bytes:
+                        raise Exception(f"Document too large: exceeds {max_bytes} bytes")
+
+                content = bytes(buffer)
+                logger.info(f"Downloaded document: {len(content)} bytes, type: {content_type}")
+                return content, content_type
                     
         except Exception as e:
             logger.error(f"Failed to download document from {blob_url}: {e}")
@@ -154,66 +238,83 @@ class DocumentProcessor:
         Returns:
             List of document chunks
         """
-        chunks = []
-
         try:
-            # Create temporary file for PDF processing
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-
-            try:
-                if PYMUPDF_AVAILABLE:
-                    # Process PDF with PyMuPDF (preferred)
-                    doc = fitz.open(temp_file_path)
-
-                    for page_num in range(len(doc)):
-                        page = doc.load_page(page_num)
-                        text = page.get_text()
-
-                        if text.strip():  # Only process pages with content
-                            # Split page into chunks
-                            page_chunks = self._split_text_into_chunks(
-                                text,
-                                {
-                                    "source": source_url,
-                                    "page": page_num + 1,
-                                    "total_pages": len(doc),
-                                    "document_type": "pdf"
-                                }
-                            )
-                            chunks.extend(page_chunks)
-
-                    doc.close()
-                    logger.info(f"Processed PDF with PyMuPDF: {len(chunks)} chunks from {len(doc)} pages")
-
-                else:
-                    # Fallback to pdfminer.six
-                    logger.info("Using pdfminer.six for PDF processing (PyMuPDF not available)")
-                    text = extract_text(temp_file_path)
-
-                    if text.strip():
-                        # Split document into chunks
-                        chunks = self._split_text_into_chunks(
-                            text,
-                            {
-                                "source": source_url,
-                                "document_type": "pdf",
-                                "extraction_method": "pdfminer"
-                            }
-                        )
-
-                    logger.info(f"Processed PDF with pdfminer.six: {len(chunks)} chunks")
-
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
+            if PYMUPDF_AVAILABLE:
+                # Process PDF with PyMuPDF (preferred) straight from the
+                # downloaded bytes — no temp-file write/read round-trip
+                loop = asyncio.get_running_loop()
+                total_pages = await loop.run_in_executor(_PDF_EXECUTOR, _page_count, content)
+
+                # Extract page text in parallel: the page range is
+                # sharded across the pool and shards run concurrently
+                shard = max(1, -(-total_pages // (os.cpu_count() or 4)))
+                shard_texts = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        _PDF_EXECUTOR, _extract_page_range,
+                        content, start, min(start + shard, total_pages)
+                    )
+                    for start in range(0, total_pages, shard)
+                ))
+
+                page_texts = [text for shard_result in shard_texts for text in shard_result]
+
+                # Chunk building is pure CPU across every page; run it
+                # off the event loop so concurrent requests stay served
+                chunks = await asyncio.to_thread(
+                    self._build_pdf_chunks, page_texts, total_pages, source_url
+                )
+
+                logger.info(f"Processed PDF with PyMuPDF: {len(chunks)} chunks from {total_pages} pages")
+
+            else:
+                # Fallback to pdfminer.six
+                logger.info("Using pdfminer.six for PDF processing (PyMuPDF not available)")
+                chunks = await asyncio.to_thread(self._parse_pdf_fallback_sync, content, source_url)
+
+                logger.info(f"Processed PDF with pdfminer.six: {len(chunks)} chunks")
 
         except Exception as e:
             logger.error(f"Failed to process PDF content: {e}")
             raise
 
         return chunks
+
+    def _build_pdf_chunks(self, page_texts: List[str], total_pages: int, source_url: str) -> List[DocumentChunk]:
+        """Chunk extracted page texts (synchronous, runs off the event loop)."""
+        chunks = []
+
+        for page_num, text in enumerate(page_texts):
+            if text.strip():  # Only process pages with content
+                # Split page into chunks
+                page_chunks = self._split_text_into_chunks(
+                    text,
+                    {
+                        "source": source_url,
+                        "page": page_num + 1,
+                        "total_pages": total_pages,
+                        "document_type": "pdf"
+                    }
+                )
+                chunks.extend(page_chunks)
+
+        return chunks
+
+    def _parse_pdf_fallback_sync(self, content: bytes, source_url: str) -> List[DocumentChunk]:
+        """Extract and chunk a PDF with pdfminer (synchronous, runs off the event loop)."""
+        text = extract_text(io.BytesIO(content))
+
+        if not text.strip():
+            return []
+
+        # Split document into chunks
+        return self._split_text_into_chunks(
+            text,
+            {
+                "source": source_url,
+                "document_type": "pdf",
+                "extraction_method": "pdfminer"
+            }
+        )
     
     async def _process_docx_content(self, content: bytes, source_url: str) -> List[DocumentChunk]:
         """
@@ -226,48 +327,48 @@ class DocumentProcessor:
         Returns:
             List of document chunks
         """
-        chunks = []
-        
         try:
-            # Create temporary file for python-docx
-            with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as temp_file:
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Process DOCX with python-docx
-                doc = Document(temp_file_path)
-                
-                # Extract text from paragraphs
-                full_text = []
-                for paragraph in doc.paragraphs:
-                    if paragraph.text.strip():
-                        full_text.append(paragraph.text)
-                
-                # Combine all text
-                document_text = '\n'.join(full_text)
-                
-                if document_text.strip():
-                    # Split document into chunks
-                    chunks = self._split_text_into_chunks(
-                        document_text,
-                        {
-                            "source": source_url,
-                            "document_type": "docx",
-                            "total_paragraphs": len(full_text)
-                        }
-                    )
-                
-                logger.info(f"Processed DOCX: {len(chunks)} chunks from {len(full_text)} paragraphs")
-                
-            finally:
-                # Clean up temporary file
-                os.unlink(temp_file_path)
-                
+            # Paragraph iteration and chunking are synchronous CPU work;
+            # run them off the event loop
+            return await asyncio.to_thread(self._parse_docx_sync, content, source_url)
         except Exception as e:
             logger.error(f"Failed to process DOCX content: {e}")
             raise
-        
+
+    def _parse_docx_sync(self, content: bytes, source_url: str) -> List[DocumentChunk]:
+        """Parse and chunk DOCX bytes (synchronous, runs off the event loop)."""
+        chunks = []
+
+        # Process DOCX with python-docx directly from the downloaded bytes
+        doc = Document(io.BytesIO(content))
+
+        # Stream paragraph text into one buffer instead of building a
+        # list of strings and joining it — halves the copies made of
+        # every character on big contracts
+        buffer = io.StringIO()
+        paragraph_count = 0
+        for paragraph in doc.paragraphs:
+            text = paragraph.text
+            if text.strip():
+                buffer.write(text)
+                buffer.write('\n')
+                paragraph_count += 1
+
+        document_text = buffer.getvalue()
+
+        if document_text.strip():
+            # Split document into chunks
+            chunks = self._split_text_into_chunks(
+                document_text,
+                {
+                    "source": source_url,
+                    "document_type": "docx",
+                    "total_paragraphs": paragraph_count
+                }
+            )
+
+        logger.info(f"Processed DOCX: {len(chunks)} chunks from {paragraph_count} paragraphs")
+
         return chunks
     
     async def _process_text_content(self, text: str, source_url: str) -> List[DocumentChunk]:
@@ -324,48 +425,59 @@ class DocumentProcessor:
         paragraphs = [p.strip() for p in text.split('\n\n') if p.strip()]
 
         if not paragraphs:
-            # Fallback to sentence splitting
-            paragraphs = [s.strip() + '.' for s in text.split('.') if s.strip()]
-
-        current_chunk = ""
+            # Fallback to sentence splitting — one linear scan with the
+            # compiled boundary regex, keeping the original punctuation
+            paragraphs = [s.strip() for s in _SENT_RE.split(text) if s.strip()]
+
+        # Single pass: the current chunk is kept as a list of parts with a
+        # running length, so no growing string is re-concatenated or
+        # re-split per paragraph — total work is linear in the text size
+        current_parts: List[str] = []
+        current_len = 0
         chunk_index = 0
 
-        for i, paragraph in enumerate(paragraphs):
-            # Check if adding this paragraph would exceed chunk size
-            potential_chunk = current_chunk + "\n\n" + paragraph if current_chunk else paragraph
+        for paragraph in paragraphs:
+            added = len(paragraph) + 2 if current_parts else len(paragraph)
 
-            if len(potential_chunk) <= optimal_chunk_size:
-                current_chunk = potential_chunk
-            else:
-                # Save current chunk if it has meaningful content
-                if current_chunk and len(current_chunk.strip()) > min_chunk_size:
-                    chunk_metadata = {
-                        **base_metadata,
-                        "chunk_index": chunk_index,
-                        "chunk_size": len(current_chunk),
-                        "chunk_type": "optimized",
-                        "paragraph_count": len([p for p in current_chunk.split('\n\n') if p.strip()])
-                    }
+            if current_len + added <= optimal_chunk_size:
+                current_parts.append(paragraph)
+                current_len += added
+                continue
 
-                    chunks.append(DocumentChunk(current_chunk.strip(), chunk_metadata))
-                    chunk_index += 1
+            current_chunk = '\n\n'.join(current_parts)
 
-                # Start new chunk with overlap from previous chunk
-                if current_chunk and len(current_chunk) > overlap_size:
-                    # Take last part of previous chunk as overlap
-                    overlap_text = current_chunk[-overlap_size:]
-                    current_chunk = overlap_text + "\n\n" + paragraph
-                else:
-                    current_chunk = paragraph
+            # Save current chunk if it has meaningful content
+            if current_chunk and len(current_chunk.strip()) > min_chunk_size:
+                chunk_metadata = {
+                    **base_metadata,
+                    "chunk_index": chunk_index,
+                    "chunk_size": current_len,
+                    "chunk_type": "optimized",
+                    "paragraph_count": len(current_parts)
+                }
+
+                chunks.append(DocumentChunk(current_chunk.strip(), chunk_metadata))
+                chunk_index += 1
+
+            # Start new chunk with overlap from previous chunk
+            if current_chunk and current_len > overlap_size:
+                # Take last part of previous chunk as overlap
+                overlap_text = current_chunk[-overlap_size:]
+                current_parts = [overlap_text, paragraph]
+                current_len = overlap_size + 2 + len(paragraph)
+            else:
+                current_parts = [paragraph]
+                current_len = len(paragraph)
 
         # Add final chunk if it has meaningful content
+        current_chunk = '\n\n'.join(current_parts)
         if current_chunk and len(current_chunk.strip()) > min_chunk_size:
             chunk_metadata = {
                 **base_metadata,
                 "chunk_index": chunk_index,
-                "chunk_size": len(current_chunk),
+                "chunk_size": current_len,
                 "chunk_type": "optimized",
-                "paragraph_count": len([p for p in current_chunk.split('\n\n') if p.strip()])
+                "paragraph_count": len(current_parts)
             }
 
             chunks.append(DocumentChunk(current_chunk.strip(), chunk_metadata))
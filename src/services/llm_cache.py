@@ -0,0 +1,83 @@
+"""In-process exact-match cache for Gemini LLM responses."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+from loguru import logger
+
+from ..core.config import get_settings
+
+
+class LLMResponseCache:
+    """Exact-match prompt → response cache with TTL and LRU eviction.
+
+    Retries, benchmark reruns and overlapping policy questions replay
+    byte-identical prompts; a hit skips the Gemini round-trip entirely.
+    Keys are SHA-256 digests of the model name and prompt, so large
+    prompts are not retained as dict keys. Near-duplicate (semantic)
+    reuse is handled at the answer level by services.semantic_cache,
+    which avoids spending an extra embedding call per lookup here.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the response cache."""
+        self.settings = get_settings()
+        self.max_entries = max_entries
+        # digest -> (response text, stored_at)
+        self._entries: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> bytes:
+        """Build a cache key from the model name and full prompt."""
+        hasher = hashlib.sha256(model.encode("utf-8"))
+        hasher.update(b"\x00")
+        hasher.update(prompt.encode("utf-8"))
+        return hasher.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Digest from make_key
+
+        Returns:
+            The cached response text, or None on miss/expiry
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        response, stored_at = entry
+        if time.monotonic() - stored_at > self.settings.cache_ttl_seconds:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)  # LRU refresh
+        self.hits += 1
+        logger.debug(f"LLM response cache hit ({self.hits} hits / {self.misses} misses)")
+        return response
+
+    def put(self, key: bytes, response: str) -> None:
+        """
+        Store a response, evicting the least recently used on overflow.
+
+        Args:
+            key: Digest from make_key
+            response: Raw response text to cache
+        """
+        self._entries[key] = (response, time.monotonic())
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> LLMResponseCache:
+    """Get the process-wide LLM response cache instance."""
+    return LLMResponseCache()
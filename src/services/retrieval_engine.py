@@ -1,7 +1,11 @@
 """Advanced retrieval engine combining vector search and keyword matching."""
 
 import asyncio
-from typing import List, Dict, Any, Optional, Tuple
+import heapq
+import operator
+import re
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from loguru import logger
 
 from ..core.config import get_settings
@@ -9,6 +13,69 @@ from ..core.gemini_client import get_gemini_client
 from .vector_store import get_vector_store
 from .document_processor import DocumentChunk
 
+# Word tokenizer shared by query and chunk tokenization
+_TOKEN_RE = re.compile(r"\w+")
+
+# Cap on retained per-document keyword indexes; sized to match the
+# route-level processed-document cache so the two evict in the same
+# ballpark instead of the much larger index structure outliving it
+_KEYWORD_INDEX_MAX = 32
+
+
+def _tokenize(text: str) -> frozenset:
+    """Tokenize text into a frozenset of lowercase word tokens."""
+    return frozenset(_TOKEN_RE.findall(text.casefold()))
+
+
+def _query_terms(query: str) -> frozenset:
+    """Tokenize a query, dropping short stopword-ish tokens.
+
+    Tokens of one or two characters ("is", "a", "of") match almost every
+    chunk and only add noise to the overlap score; they are filtered out
+    once here instead of being tested against every chunk. Falls back to
+    the unfiltered set for very short queries.
+    """
+    tokens = _tokenize(query)
+    significant = frozenset(t for t in tokens if len(t) > 2)
+    return significant or tokens
+
+
+class _ScoredChunk(NamedTuple):
+    """Lightweight scoring record used inside the keyword-search loop.
+
+    A NamedTuple is cheaper to build and compare than the 7-key result
+    dict, so candidates are scored as tuples and only the returned top-k
+    are materialized into the dict shape the callers expect.
+    """
+
+    score: float
+    chunk_index: int
+
+
+class _IndexedChunks:
+    """Structure-of-arrays view of a document's chunks plus inverted index.
+
+    Parallel lists keep the per-question scoring loop on flat sequences
+    (one index, one fetch) rather than repeated attribute/dict lookups on
+    chunk objects.
+    """
+
+    __slots__ = ("texts", "metadatas", "token_sets", "inverted")
+
+    def __init__(self, chunks: List[DocumentChunk]):
+        self.texts: List[str] = [chunk.text for chunk in chunks]
+        self.metadatas: List[Dict[str, Any]] = [chunk.metadata for chunk in chunks]
+        self.token_sets: List[frozenset] = [chunk.token_set for chunk in chunks]
+
+        inverted: Dict[str, set] = defaultdict(set)
+        for i, token_set in enumerate(self.token_sets):
+            for token in token_set:
+                inverted[token].add(i)
+        self.inverted: Dict[str, set] = dict(inverted)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
 
 class RetrievalEngine:
     """Advanced retrieval engine for finding relevant document chunks."""
@@ -18,6 +85,13 @@ class RetrievalEngine:
         self.settings = get_settings()
         self.gemini_client = get_gemini_client()
         self._vector_store = None
+        # Per-document keyword index built at store time; used as the
+        # fallback when vector search returns nothing. Chunk data is kept
+        # as parallel arrays (texts/metadatas/token_sets) so scoring scans
+        # flat lists instead of chasing object attributes. Bounded FIFO
+        # (oldest document evicted) so a long-running server doesn't
+        # accumulate an index per document ever stored.
+        self._keyword_indexes: "OrderedDict[str, _IndexedChunks]" = OrderedDict()
     
     async def initialize(self):
         """Initialize the retrieval engine."""
@@ -40,9 +114,13 @@ class RetrievalEngine:
             Storage result with statistics
         """
         try:
+            # Build the in-memory keyword index before any network call so
+            # the fallback path works even if vector storage fails later.
+            self._index_document_chunks(document_id, chunks)
+
             if not self._vector_store:
                 await self.initialize()
-            
+
             # Store chunks in vector store
             stored_count = await self._vector_store.store_document_chunks(chunks, document_id)
             
@@ -94,17 +172,21 @@ class RetrievalEngine:
                 filter_metadata=filter_metadata
             )
             
+            if not vector_results:
+                logger.warning("Vector search returned no results, trying keyword index")
+                return self._keyword_search(query, document_id)
+
             if use_hybrid_search:
                 # Enhance with keyword matching
                 enhanced_results = await self._enhance_with_keyword_search(query, vector_results)
                 return enhanced_results
             else:
                 return vector_results
-                
+
         except Exception as e:
             logger.error(f"Failed to retrieve relevant chunks: {e}")
-            # Fallback to empty results
-            return []
+            # Fallback to local keyword search over the indexed chunks
+            return self._keyword_search(query, document_id)
 
     async def get_all_chunks(self, document_id: str) -> List[Dict[str, Any]]:
         """
@@ -130,6 +212,82 @@ class RetrievalEngine:
             logger.error(f"Failed to get all chunks: {e}")
             return []
     
+    def _index_document_chunks(self, document_id: str, chunks: List[DocumentChunk]) -> None:
+        """
+        Build the SoA keyword index for a document.
+
+        Args:
+            document_id: Document identifier
+            chunks: Chunks to index
+        """
+        indexed = _IndexedChunks(chunks)
+        self._keyword_indexes[document_id] = indexed
+        self._keyword_indexes.move_to_end(document_id)
+        while len(self._keyword_indexes) > _KEYWORD_INDEX_MAX:
+            self._keyword_indexes.popitem(last=False)  # FIFO eviction
+        logger.debug(f"Indexed {len(indexed)} chunks ({len(indexed.inverted)} tokens) for {document_id}")
+
+    def _keyword_search(
+        self,
+        query: str,
+        document_id: Optional[str],
+        top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Score chunks against the query using the inverted index.
+
+        Only chunks sharing at least one token with the query are scored,
+        so work is proportional to the posting lists touched rather than
+        the whole document.
+
+        Args:
+            query: Search query
+            document_id: Document whose index to search
+            top_k: Number of results to return
+
+        Returns:
+            List of scored chunks in the same shape as vector results
+        """
+        indexed = self._keyword_indexes.get(document_id)
+        if not indexed:
+            return []
+
+        query_tokens = _query_terms(query)
+        if not query_tokens:
+            return []
+
+        # Union of posting lists: candidate chunks only
+        candidates = set().union(*(indexed.inverted.get(token, ()) for token in query_tokens))
+
+        token_sets = indexed.token_sets
+        texts = indexed.texts
+        metadatas = indexed.metadatas
+
+        # Score as NamedTuples; result dicts are only built for the top-k
+        # survivors instead of every candidate.
+        scored = [
+            _ScoredChunk(len(query_tokens & token_sets[i]) / len(query_tokens), i)
+            for i in candidates
+        ]
+        # O(N log k) top-k selection instead of sorting every candidate
+        top = heapq.nlargest(top_k, scored)
+        logger.debug(f"Keyword index matched {len(scored)} chunks for query")
+
+        results = []
+        for candidate in top:
+            i = candidate.chunk_index
+            metadata = metadatas[i]
+            results.append({
+                "id": f"{document_id}_kw_{i}",
+                "score": candidate.score,
+                "text": texts[i],
+                "page": metadata.get("page"),
+                "document_id": document_id,
+                "chunk_index": i,
+                "metadata": metadata
+            })
+        return results
+
     async def _enhance_with_keyword_search(
         self, 
         query: str, 
@@ -146,18 +304,24 @@ class RetrievalEngine:
             Enhanced results with combined scoring
         """
         try:
-            # Extract keywords from query
-            query_words = set(query.lower().split())
-            
+            # Tokenize the query once (short stopword-ish tokens dropped);
+            # chunk tokens are cached on the result dict so repeat
+            # questions don't re-scan the text.
+            query_tokens = _query_terms(query)
+
             enhanced_results = []
-            
+
             for result in vector_results:
-                text = result.get("text", "").lower()
-                
-                # Calculate keyword match score
-                keyword_matches = sum(1 for word in query_words if word in text)
-                keyword_score = keyword_matches / len(query_words) if query_words else 0
-                
+                chunk_tokens = result.get("_token_set")
+                if chunk_tokens is None:
+                    chunk_tokens = _tokenize(result.get("text", ""))
+                    result["_token_set"] = chunk_tokens
+
+                # Set intersection: O(1) membership per term instead of a
+                # substring scan over the chunk text for every query word
+                keyword_matches = len(query_tokens & chunk_tokens)
+                keyword_score = keyword_matches / len(query_tokens) if query_tokens else 0
+
                 # Combine vector similarity and keyword scores
                 vector_score = result.get("score", 0.0)
                 combined_score = (0.7 * vector_score) + (0.3 * keyword_score)
@@ -171,8 +335,8 @@ class RetrievalEngine:
                 
                 enhanced_results.append(enhanced_result)
             
-            # Sort by combined score
-            enhanced_results.sort(key=lambda x: x["combined_score"], reverse=True)
+            # Sort by combined score (itemgetter keeps key extraction in C)
+            enhanced_results.sort(key=operator.itemgetter("combined_score"), reverse=True)
             
             logger.debug(f"Enhanced {len(enhanced_results)} results with keyword matching")
             return enhanced_results
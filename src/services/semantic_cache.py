@@ -0,0 +1,107 @@
+"""In-process semantic cache for question → answer reuse."""
+
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from loguru import logger
+
+from ..core.config import get_settings
+
+# Word tokenizer matching the retrieval engine's tokenization
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> frozenset:
+    """Tokenize text into a frozenset of lowercase word tokens."""
+    return frozenset(_TOKEN_RE.findall(text.casefold()))
+
+
+class SemanticCache:
+    """Similarity cache mapping (document_id, question) to answers.
+
+    Users frequently ask semantically equivalent questions ("Is knee
+    surgery covered?" / "Does the policy cover knee surgery?"), so on a
+    hit the whole retrieval + LLM pipeline is skipped. Similarity is
+    token-set Jaccard overlap — cheap, dependency-free, and requiring no
+    extra embedding call on misses. Entries expire after
+    settings.cache_ttl_seconds and the cache is bounded FIFO.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.9, max_entries: int = 512):
+        """Initialize the semantic cache."""
+        self.settings = get_settings()
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        # (document_id, question) -> (token_set, answer, stored_at)
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[frozenset, Any, float]]" = OrderedDict()
+
+    def get(self, document_id: str, question: str) -> Optional[Any]:
+        """
+        Look up a cached answer for a semantically similar question.
+
+        Args:
+            document_id: Document the question was asked against
+            question: The incoming question
+
+        Returns:
+            The cached answer on a similarity hit, otherwise None
+        """
+        query_tokens = _tokenize(question)
+        if not query_tokens:
+            return None
+
+        now = time.monotonic()
+        ttl = self.settings.cache_ttl_seconds
+
+        best_answer = None
+        best_similarity = self.similarity_threshold
+        expired = []
+
+        for key, (token_set, answer, stored_at) in self._entries.items():
+            if now - stored_at > ttl:
+                expired.append(key)
+                continue
+            if key[0] != document_id:
+                continue
+            union = len(query_tokens | token_set)
+            similarity = len(query_tokens & token_set) / union if union else 0.0
+            if similarity >= best_similarity:
+                best_similarity = similarity
+                best_answer = answer
+
+        for key in expired:
+            del self._entries[key]
+
+        if best_answer is not None:
+            logger.debug(f"Semantic cache hit (similarity {best_similarity:.2f}) for: {question[:50]}")
+        return best_answer
+
+    def put(self, document_id: str, question: str, answer: Any) -> None:
+        """
+        Store an answer for later similarity lookups.
+
+        Args:
+            document_id: Document the question was asked against
+            question: The question that produced the answer
+            answer: The answer object to cache
+        """
+        token_set = _tokenize(question)
+        if not token_set:
+            return
+
+        self._entries[(document_id, question)] = (token_set, answer, time.monotonic())
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # FIFO eviction
+
+
+# Global semantic cache instance
+_semantic_cache = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the global semantic cache instance."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -237,8 +237,8 @@ class VectorStore:
             else:
                 score += 1
 
-            # Prefer chunks with more content indicators
-            if any(keyword in chunk.text.lower() for keyword in ['policy', 'coverage', 'benefit', 'condition', 'exclusion']):
+            # Prefer chunks with more content indicators (cached casefold)
+            if any(keyword in chunk.text_lower for keyword in ['policy', 'coverage', 'benefit', 'condition', 'exclusion']):
                 score += 2
 
             # Prefer chunks with structured content